@@ -0,0 +1,270 @@
+"""Pure numeric kernels for the combat arithmetic hot path.
+
+These helpers work on plain ints only, so batch simulations can call
+them directly (or JIT-compile them) without constructing character
+objects.
+"""
+
+import random
+
+# layout of the flat stat lists used by the batch simulator
+HP, MAX_HP, AP, DP, MAX_DP, SP, LUCK = range(7)
+
+
+def compute_damage(attack_points: int, defense_points: int, luck: int, roll: int):
+    """Compute the damage of a basic attack.
+
+    Parameters
+    ----------
+    attack_points : int
+        The attacker's attack points.
+    defense_points : int
+        The target's defense points.
+    luck : int
+        The attacker's luck (max - 100).
+    roll : int or float
+        A uniform random roll in [0, 100] for the critical hit check.
+
+    Returns
+    -------
+    damage : int
+        The health points to deduct from the target.
+    is_critical : bool
+        True if the attack is a critical hit, False otherwise.
+    """
+
+    # critical hits ignores target's defense points and deals
+    # double the attacker's AP
+    if roll <= luck:
+        return 2 * attack_points, True
+
+    # if target's defense points is more than attacker's AP no damage is dealt
+    return max(attack_points - defense_points, 0), False
+
+
+def reflective_shield(health_points: int, defense_points: int, damage: int):
+    """Reflect incoming damage back onto the attacker's stats.
+
+    Parameters
+    ----------
+    health_points : int
+        The attacker's health points.
+    defense_points : int
+        The attacker's defense points.
+    damage : int
+        The damage the attacker intended to deal.
+
+    Returns
+    -------
+    tuple : (new_hp, new_dp, dp_damage, hp_damage).
+    """
+
+    dp_damage = min(damage, defense_points)
+    hp_damage = max(0, damage - defense_points)
+    return (
+        health_points - hp_damage,
+        defense_points - dp_damage,
+        dp_damage,
+        hp_damage,
+    )
+
+
+def claw_swipe(health_points: int, defense_points: int, damage: int):
+    """Strip the target's defense and spill leftover damage onto HP.
+
+    Parameters
+    ----------
+    health_points : int
+        The target's health points.
+    defense_points : int
+        The target's defense points.
+    damage : int
+        The damage rolled for the swipe.
+
+    Returns
+    -------
+    tuple : (new_hp, net_damage) with defense always dropping to 0.
+    """
+
+    net_damage = max(0, damage - defense_points)
+    return health_points - net_damage, net_damage
+
+
+def crippling_strike(speed_points: int, reduction: int) -> int:
+    """Reduce speed points without going below zero.
+
+    Parameters
+    ----------
+    speed_points : int
+        The target's speed points.
+    reduction : int
+        The rolled speed reduction.
+    """
+
+    return max(0, speed_points - reduction)
+
+
+def stats_from_character(character) -> list:
+    """Build the flat stat list for a character object.
+
+    Parameters
+    ----------
+    character : BaseCharacter
+        The character to read the stats from.
+
+    Returns
+    -------
+    list : The [HP, MAX_HP, AP, DP, MAX_DP, SP, LUCK] stat list.
+    """
+
+    return [
+        character.health_points,
+        character.max_health_points,
+        character.attack_points,
+        character.defense_points,
+        character.max_defense_points,
+        character.speed_points,
+        character.luck,
+    ]
+
+
+def _basic_attack(attacker: list, target: list, rng: random.Random) -> None:
+    # stats-only port of BaseCharacter.basic_attack (no effects, no logs)
+    attacker[SP] -= 1
+    damage, _ = compute_damage(
+        attacker[AP], target[DP], attacker[LUCK], rng.random() * 100.0
+        )
+    target[HP] -= damage
+    target[DP] -= 1
+
+
+def simulate_battle(player_stats: list, enemy_stats: list, rng: random.Random) -> bool:
+    """Simulate one headless 1v1 battle on flat stat lists.
+
+    The enemy follows EnemyCharacter.select_action's rules; the player
+    always uses a basic attack (no skills). Inputs are not mutated.
+
+    Parameters
+    ----------
+    player_stats : list
+        The player's [HP, MAX_HP, AP, DP, MAX_DP, SP, LUCK] stats.
+    enemy_stats : list
+        The enemy's stats in the same layout.
+    rng : random.Random
+        The random number generator to draw from.
+
+    Returns
+    -------
+    bool : True if the player won, False otherwise.
+    """
+
+    player = list(player_stats)
+    enemy = list(enemy_stats)
+
+    while player[HP] > 0 and enemy[HP] > 0:
+
+        # faster character acts; ties are settled randomly
+        if player[SP] > enemy[SP] or \
+                (player[SP] == enemy[SP] and rng.getrandbits(1)):
+            _basic_attack(player, enemy, rng)
+            idle = enemy
+
+        # enemy turn, mirroring EnemyCharacter.select_action
+        elif (player[HP] + player[DP]) < enemy[AP]:
+            _basic_attack(enemy, player, rng)
+            idle = player
+
+        elif enemy[HP] < 0.2 * enemy[MAX_HP]:
+            # heal
+            enemy[SP] -= 1
+            enemy[HP] += rng.randint(1, 10)
+            idle = player
+
+        elif enemy[DP] < 0.5 * enemy[MAX_DP]:
+            # defend
+            enemy[DP] = enemy[MAX_DP]
+            idle = player
+
+        else:
+            _basic_attack(enemy, player, rng)
+            idle = player
+
+        # idle character's stat update (see update_idle_character_stats)
+        idle[SP] += 1
+        idle[DP] = max(idle[DP], 0)
+
+    return enemy[HP] <= 0 < player[HP]
+
+
+def batch_simulate(
+    player_stats: list, enemy_stats: list, n_battles: int, seed: int = None
+) -> int:
+    """Simulate many battles and count player wins.
+
+    Parameters
+    ----------
+    player_stats : list
+        The player's [HP, MAX_HP, AP, DP, MAX_DP, SP, LUCK] stats.
+    enemy_stats : list
+        The enemy's stats in the same layout.
+    n_battles : int
+        The number of battles to simulate.
+    seed : int
+        Seed for the simulation RNG. Defaults to None.
+
+    Returns
+    -------
+    int : The number of battles the player won.
+    """
+
+    rng = random.Random(seed)
+
+    return sum(
+        simulate_battle(player_stats, enemy_stats, rng) for _ in range(n_battles)
+    )
+
+
+def claw_swipe_batch(health_points: list, defense_points: list, rng: random.Random):
+    """Resolve one claw swipe per battle across parallel stat lists.
+
+    Parameters
+    ----------
+    health_points : list
+        One target HP value per battle.
+    defense_points : list
+        One target DP value per battle, same length.
+    rng : random.Random
+        The RNG to draw the damage rolls from.
+
+    Returns
+    -------
+    tuple : (new_hp, new_dp) lists; defense always drops to 0.
+    """
+
+    rand = rng.random
+
+    new_hp = [
+        hp - max(0, 25 + int(rand() * 11) - dp)
+        for hp, dp in zip(health_points, defense_points)
+    ]
+    return new_hp, [0] * len(new_hp)
+
+
+def crippling_strike_batch(speed_points: list, rng: random.Random) -> list:
+    """Resolve one crippling strike per battle across a stat list.
+
+    Parameters
+    ----------
+    speed_points : list
+        One target SP value per battle.
+    rng : random.Random
+        The RNG to draw the speed reduction rolls from.
+
+    Returns
+    -------
+    list : The new SP values, floored at zero.
+    """
+
+    rand = rng.random
+
+    return [max(0, sp - (5 + int(rand() * 11))) for sp in speed_points]
@@ -0,0 +1,46 @@
+"""Typed skill attributes generated from data/skill_attributes.csv.
+
+Generated by scripts/gen_skill_attrs.py -- do not edit by hand; edit
+the CSV and re-run the script instead.
+"""
+
+SKILL_ATTRS = {'WhiskerGuard': {'name': 'Whisker Guard',
+                  'mp_cost': 10,
+                  'sp_cost': 0,
+                  'require_target': False,
+                  'belongs_to': 'Tank'},
+ 'ClawSwipe': {'name': 'Claw Swipe',
+               'mp_cost': 5,
+               'sp_cost': 2,
+               'require_target': True,
+               'belongs_to': 'Tank'},
+ 'IllusionaryAura': {'name': 'Illusionary Aura',
+                     'mp_cost': 15,
+                     'sp_cost': 5,
+                     'require_target': True,
+                     'belongs_to': 'MirrorMage'},
+ 'ReflectiveShield': {'name': 'Reflective Shield',
+                      'mp_cost': 20,
+                      'sp_cost': 0,
+                      'require_target': False,
+                      'belongs_to': 'MirrorMage'},
+ 'HealingPurr': {'name': 'Healing Purr',
+                 'mp_cost': 8,
+                 'sp_cost': 0,
+                 'require_target': False,
+                 'belongs_to': 'Healer'},
+ 'LuckyCharm': {'name': 'Luck Charm',
+                'mp_cost': 12,
+                'sp_cost': 0,
+                'require_target': False,
+                'belongs_to': 'Healer'},
+ 'PurrfectStrike': {'name': 'Purrfect Strike',
+                    'mp_cost': 15,
+                    'sp_cost': 5,
+                    'require_target': True,
+                    'belongs_to': 'Assassin'},
+ 'CripplingStrike': {'name': 'Crippling Strike',
+                     'mp_cost': 12,
+                     'sp_cost': 3,
+                     'require_target': False,
+                     'belongs_to': 'Assassin'}}
@@ -0,0 +1,15 @@
+"""Typed stat tables generated from the data/ CSVs.
+
+Generated by scripts/gen_stat_tables.py -- do not edit by hand; edit
+the CSVs and re-run the script instead.
+"""
+
+JOB_STATS = {'Tank': {'HP': 150, 'AP': 8, 'DP': 20, 'SP': 4, 'MP': 5, 'Luck': 5},
+ 'MirrorMage': {'HP': 100, 'AP': 6, 'DP': 5, 'SP': 8, 'MP': 20, 'Luck': 30},
+ 'Healer': {'HP': 120, 'AP': 4, 'DP': 8, 'SP': 6, 'MP': 25, 'Luck': 12},
+ 'Assassin': {'HP': 80, 'AP': 10, 'DP': 3, 'SP': 10, 'MP': 50, 'Luck': 10}}
+
+ENEMY_STATS = {'Dreadspire': {'HP': 120, 'AP': 20, 'DP': 18, 'SP': 3, 'Luck': 25},
+ 'Gloomreaper': {'HP': 80, 'AP': 15, 'DP': 4, 'SP': 6, 'Luck': 30},
+ 'Viperstrike': {'HP': 100, 'AP': 10, 'DP': 6, 'SP': 4, 'Luck': 20},
+ 'Doomshroud': {'HP': 110, 'AP': 25, 'DP': 10, 'SP': 8, 'Luck': 40}}
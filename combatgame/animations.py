@@ -0,0 +1,513 @@
+"""
+Animation Module
+================
+
+This module contains the terminal animations for the game: typing and
+line-by-line text effects, the combat start/welcome/game over screens
+and the thunderstorm, plus the shared skip-listener thread.
+
+"""
+
+import os
+import sys
+import time
+import random
+import select
+import textwrap
+import threading
+from typing import AnyStr, List, TYPE_CHECKING
+
+# platform-specific keyboard handling for the skip listener: msvcrt
+# only exists on windows, termios/tty only on unix; the skip listener
+# picks its branch on os.name, so the absent side is never touched
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
+try:
+    import termios
+    import tty
+except ImportError:
+    termios = tty = None
+
+from combatgame.ui import Ui, _CLEAR_SCREEN
+
+if TYPE_CHECKING:
+    from combatgame.characters import BaseCharacter
+    from combatgame.enemies import EnemyCharacter
+
+
+# every raindrop token the thunderstorm can draw: an optional " / "
+# followed by 1-5 blank groups, matching the old randint(0,1)/randint(1,5)
+# pair; both rolls were uniform, so uniform choices over the combos
+# keeps the distribution
+_RAIN_TOKENS = [
+    " / " * slash + "   " * blanks
+    for slash in (0, 1)
+    for blanks in (1, 2, 3, 4, 5)
+]
+
+
+class Animation:
+    """Container class for animation functions."""
+
+    # guards stdout between the animation loop and its skip-listener
+    # thread, so their output can never interleave
+    _print_lock = threading.Lock()
+
+    # set by the shared listener thread when the player presses
+    # space during an animation
+    _skip_event = threading.Event()
+
+    # set while an animation wants skip keys; the listener only
+    # touches stdin while this is set, so it can't steal input()
+    # characters
+    _listening = threading.Event()
+
+    # the single skip-listener daemon thread, started on first use
+    _skip_listener: threading.Thread = None
+
+    @classmethod
+    def _skip_poll_loop(cls):
+        """Poll for the spacebar whenever an animation is listening.
+
+            Runs forever on the shared daemon thread; blocks on
+            _listening between animations so it costs nothing while
+            idle.
+            """
+
+        while True:
+            cls._listening.wait()
+
+            # for windows
+            if os.name == "nt":
+                while cls._listening.is_set():
+                    if msvcrt.kbhit() and ord(msvcrt.getch()) == 32:
+                        cls._skip_event.set()
+                    else:
+                        time.sleep(0.02)
+
+            # for unix based systems: poll with a timeout instead of
+            # blocking on read, so the loop re-checks _listening
+            else:
+                # put stdin into cbreak (non-canonical, no echo
+                # delay) for the listening window, so the spacebar
+                # arrives without Enter; restored before the next
+                # input()
+                try:
+                    stdin_fd = sys.stdin.fileno()
+                    old_attrs = termios.tcgetattr(stdin_fd)
+                    tty.setcbreak(stdin_fd)
+                except (OSError, ValueError, termios.error):
+                    stdin_fd = None
+
+                try:
+                    while cls._listening.is_set():
+                        readable, _, _ = select.select([sys.stdin], [], [], 0.05)
+                        if readable and sys.stdin.read(1) == " ":
+                            cls._skip_event.set()
+
+                finally:
+                    if stdin_fd is not None:
+                        termios.tcsetattr(stdin_fd, termios.TCSADRAIN, old_attrs)
+
+    @classmethod
+    def _ensure_skip_listener(cls):
+        """Start the shared skip-listener thread on first use."""
+
+        if cls._skip_listener is None:
+            cls._skip_listener = threading.Thread(
+                target=cls._skip_poll_loop, daemon=True
+                )
+            cls._skip_listener.start()
+
+    @classmethod
+    def print_with_animation(
+        cls,
+        string: AnyStr = None,
+        line_length: int = 80,
+        speed: int = 500
+    ) -> None:
+        """Prints text with typing animation.
+
+            Parameters
+            ----------
+            string : str
+                The string to print. Defaults to None.
+
+            line_length : int
+                Max number of characters per line. Defaults to 80.
+
+            speed : int 
+                The speed of the typing animation (characters per minute).
+                Defaults to 500.
+            """
+        string = string.replace("\n", "")
+
+        # arm the shared skip listener instead of spawning a thread
+        # per animation
+        cls._ensure_skip_listener()
+        cls._skip_event.clear()
+        cls._listening.set()
+        skip_event = cls._skip_event
+
+        # typing delay per character, computed once outside the loop
+        sleep_per_char = speed / (5 * 3600)
+
+        # characters are emitted in small batches: one write/flush
+        # and one coalesced sleep per batch instead of per character,
+        # which is indistinguishable to the eye at these speeds but
+        # cuts the write() syscalls by the batch size
+        batch_size = 8
+        batch = []
+        line_width = 0
+
+        # write straight to the stdout fd when stdout is a real
+        # terminal, bypassing the TextIOWrapper encode/lock/buffer
+        # stack per batch; redirected stdout keeps the text layer
+        try:
+            out_fd = sys.stdout.fileno() if sys.stdout.isatty() else None
+        except (AttributeError, OSError, ValueError):
+            out_fd = None
+
+        def flush_batch():
+            # emit the pending characters in a single locked write
+            with cls._print_lock:
+                if out_fd is not None:
+                    os.write(out_fd, "".join(batch).encode("utf-8"))
+
+                else:
+                    sys.stdout.write("".join(batch))
+                    sys.stdout.flush()
+
+            # one sleep covering every non-space character emitted
+            pause = sleep_per_char * sum(
+                not batched_char.isspace() for batched_char in batch
+                )
+            if pause:
+                time.sleep(pause)
+
+            batch.clear()
+
+        print("Press [space bar] to skip...")
+
+        # drain the text layer before the raw fd writes start, so
+        # the prompt can't arrive after the animation
+        sys.stdout.flush()
+
+        # loops through every character in the string provided and
+        # prints it batch by batch
+        for char in string:
+
+            # check if skip is activated
+            if skip_event.is_set():
+                # one locked write for the whole wrapped text, so
+                # the listener thread can't interleave output and
+                # the skip path costs a single syscall
+                with cls._print_lock:
+                    Ui.invalidate_frame()
+                    sys.stdout.write(
+                        _CLEAR_SCREEN + "\n"
+                        + '\n'.join(textwrap.wrap(string, line_length))
+                        + "\n"
+                        )
+                    sys.stdout.flush()
+                batch.clear()
+                break
+
+            batch.append(char)
+            line_width += 1
+
+            # checks if line exceeded line_length limit
+            if char == " " and line_width > line_length:
+                batch.append("\n")  # insert new line
+                line_width = 0  # resets line width
+                flush_batch()
+
+            # pause at a fullstop
+            elif char == ".":
+                flush_batch()
+                time.sleep(0.3)
+
+            elif len(batch) >= batch_size:
+                flush_batch()
+
+        # emit whatever is left over from the last batch
+        if batch:
+            flush_batch()
+
+        # disarm the listener so it leaves stdin alone until the
+        # next animation
+        cls._listening.clear()
+
+    @staticmethod
+    def print_line_by_line(string, delay=0.1):
+        """Scrolling up animation for printing text.
+            
+            Parameters
+            ----------
+            string : str
+                The string to print.
+            delay : float
+                The delay in seconds. Defaults to 0.1.
+            """
+
+        # bind the stdout methods once so the loop skips the
+        # attribute lookups and print's argument handling
+        write = sys.stdout.write
+        flush = sys.stdout.flush
+        sleep = time.sleep
+
+        for line in string.split("\n"):
+            write(line + "\n")
+            flush()
+            sleep(delay)
+
+    @staticmethod
+    def stream_lore(paragraphs):
+        """Display lore paragraphs one at a time from any iterable.
+
+        Consumes the iterable lazily, so a generator source never has
+        more than one paragraph materialized at once.
+
+        Parameters
+        ----------
+        paragraphs : iterable of str
+            The paragraphs to display, e.g. lore.iter_paragraphs(name).
+        """
+        # clear terminal
+        Ui.clear_terminal()
+
+        # loops through paragraphs to print to console
+        for paragraph in paragraphs:
+            paragraph = paragraph.rstrip()
+            Animation.print_with_animation(paragraph)
+            input("\n\n\nPress enter to continue...")
+            Ui.clear_terminal()
+
+    @staticmethod
+    def execute_lore(lore=None):
+        """prints the lore given.
+        Use "|" to split sentences into paragraphs.
+
+        Parameters
+        ----------
+        lore : str or iterable of str
+        the lore to be displayed, either a "|"-delimited string or
+        pre-split paragraphs. Defaults to None.
+        """
+
+        # pre-split paragraphs pass straight through; only a bare
+        # string still gets split here
+        Animation.stream_lore(lore.split("|") if isinstance(lore, str) else lore)
+
+    @staticmethod
+    def display_welcome_screen():
+        """Prints the welcome screen."""
+
+        # clears terminal screen
+        Ui.clear_terminal()
+
+        Animation.print_line_by_line(r"""
+CATastrophe Chronicles: The Wildcat Cafe
+──────────┰──────────────────┰──────────
+          ┃                  ┃
+      ╭──━┸━─━─━─━─━─━─━─━─━─┷─━─╮
+      ┃                          ┃
+      │        Welcome To        │
+      │    The Wildcat Cafe!     │
+      ┃                          ┃
+      ╰─━─━─━─━─━─━─━─━─━─━─━─━─━╯
+            """)
+
+        Animation.print_line_by_line(r"""
+           _   _._
+          |_|-'_~_`-._
+       _.-'-_~_- _-~-_`-._
+   _.-'_~-_~-_-~-_~_~-_~-_`-._
+  ━━┳━━━━━━━━━━━━━━━━━━━━━━━┳━━
+    ┃  ┌─┬─┐    σ    ┌─┬─┐  ┃
+    ┃  ├─┼─┤  ┏━━━┓  ├─┼─┤  ┃   
+  ._┃  └─┴─┘  ┃  .┃  └─┴─┘  ┃_._._._._._._._._._._._._._._._._.  
+  |=┗━━━━━━━━━┻━━━┻━━━━━━━━━┛|=|=|=|=|=|=|=|=|=|=|=|=|=|=|=|=|=| 
+^^^^^^^^^^^^^^ === ^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^  
+    __________    ===             : ¨·.·¨ :
+   <_CatσCafe_>     ===            ` ·. 🦋
+       ^|^            ===                   ╱|、
+        |                ===              (˚ˎ。7               
+                            ===            |、˜〵        
+                            ===            じしˍ,)ノ          
+            """)
+
+    @staticmethod
+    def display_combat_start(
+        player_characters: List["BaseCharacter"],
+        enemy_characters: List["EnemyCharacter"]
+        ):
+        """Displays the animation before the start of combat.
+            
+            Parameters
+            ----------
+            player_characters : List of BaseCharacter
+                The player characters involved in the combat.
+            enemy_characters : List of EnemyCharacter
+                The enemy characters involved in the combat.
+            """
+
+        def display_teams(team: list):
+            # display the whole team and the characters names
+
+            # variable to store each characters name and their starting column position
+            character_names_list = []
+
+            Ui.display_ascii_art(*team, sep="")
+
+            # loop through every character
+            for character in team:
+
+                # add names below their ascii art respectively
+                character_names_list.append(
+                    (f"Name: {character.name}", character.starting_column_position)
+                    )
+
+            # align character names to their respective position by
+            # emitting the gap then the name; expandtabs re-scanned
+            # the whole accumulated line for every name
+            parts = []
+            current_column = 0
+            for string, column in character_names_list:
+                parts.append(" " * (column - current_column))
+                parts.append(string)
+                current_column = column + len(string)
+
+            # print the formatted line
+            print(''.join(parts))
+
+        Ui.clear_terminal()
+
+        # display player characters
+        display_teams(player_characters)
+        time.sleep(1)
+        Ui.clear_terminal()
+
+        print("""\n\n\n
+ oooooo     oooo  .oooooo..o 
+  `888.     .8'  d8P'    `Y8 
+   `888.   .8'   Y88bo.      
+    `888. .8'     `"Y8888o.  
+     `888.8'          `"Y88b 
+      `888'      oo     .d8P 
+       `8'       8""88888P'  
+            """)
+        time.sleep(1)
+        Ui.clear_terminal()
+
+        # display enemy characters
+        display_teams(enemy_characters)
+        time.sleep(1)
+        Ui.clear_terminal()
+
+        print("""\n\n\n
+________  ______   ______   __    __  ________  __ 
+/        |/      | /      \\ /  |  /  |/         |/ |
+$$$$$$$$/ $$$$$$/ /$$$$$$  |$$ |  $$ |$$$$$$$$/ $$ |
+$$ |__      $$ |  $$ | _$$/ $$ |__$$ |   $$ |   $$ |
+$$    |     $$ |  $$ |/    |$$    $$ |   $$ |   $$ |
+$$$$$/      $$ |  $$ |$$$$ |$$$$$$$$ |   $$ |   $$/ 
+$$ |       _$$ |_ $$ \\__$$ |$$ |  $$ |   $$ |    __ 
+$$ |      / $$   |$$    $$/ $$ |  $$ |   $$ |   /  |
+$$/       $$$$$$/  $$$$$$/  $$/   $$/    $$/    $$/                              
+            """)
+        time.sleep(1)
+
+    @staticmethod
+    def display_game_over():
+        """Displays game over ASCII Art,"""
+
+        Animation.print_line_by_line(
+            """\n\n\n
+  ______    ______   __       __  ________ 
+ /      \\  /      \\ /  \\     /  |/        |
+/$$$$$$  |/$$$$$$  |$$  \\   /$$ |$$$$$$$$/ 
+$$ | _$$/ $$ |__$$ |$$$  \\ /$$$ |$$ |__    
+$$ |/    |$$    $$ |$$$$  /$$$$ |$$    |   
+$$ |$$$$ |$$$$$$$$ |$$ $$ $$/$$ |$$$$$/    
+$$ \\__$$ |$$ |  $$ |$$ |$$$/ $$ |$$ |_____ 
+$$    $$/ $$ |  $$ |$$ | $/  $$ |$$       |
+ $$$$$$/  $$/   $$/ $$/      $$/ $$$$$$$$/ 
+            """
+        )
+        Animation.print_line_by_line("""
+  ______   __     __  ________  _______  
+ /      \\ /  |   /  |/        |/       \\ 
+/$$$$$$  |$$ |   $$ |$$$$$$$$/ $$$$$$$  |
+$$ |  $$ |$$ |   $$ |$$ |__    $$ |__$$ |
+$$ |  $$ |$$  \\ /$$/ $$    |   $$    $$< 
+$$ |  $$ | $$  /$$/  $$$$$/    $$$$$$$  |
+$$ \\__$$ |  $$ $$/   $$ |_____ $$ |  $$ |
+$$    $$/    $$$/    $$       |$$ |  $$ |
+ $$$$$$/      $/     $$$$$$$$/ $$/   $$/                                                                                       
+            """)
+
+    @staticmethod
+    def display_thunderstorm(frames: int=20, flash: bool=True):
+        """Animate a thunderstorm in console.
+            
+            Parameters
+            ----------
+            frames : int
+                The amount of frames to animate. Defaults to 20.
+            flash : bool
+                Whether to display lightning flashes. Defaults to True.
+            """
+
+        width, height = os.get_terminal_size()
+
+        running_animation = True
+
+        def lightning_animation():
+            # for windows
+            if os.name == "nt":
+                # set the console attributes through Win32 directly
+                # instead of forking cmd.exe for `color` five times
+                # a second; windows-only, so imported here
+                import ctypes  # pylint: disable=import-outside-toplevel
+
+                kernel32 = ctypes.windll.kernel32
+                console_handle = kernel32.GetStdHandle(-11)
+
+                while running_animation:
+                    for _ in range(2):
+                        # flash twice
+                        kernel32.SetConsoleTextAttribute(console_handle, 0x70)
+                        time.sleep(0.2)
+                        kernel32.SetConsoleTextAttribute(console_handle, 0x07)
+                        time.sleep(0.2)
+
+                    time.sleep(3)
+
+        if flash:
+            # run the lightning animation in the background
+            lightning_animation = threading.Thread(target=lightning_animation)
+            lightning_animation.start()
+
+        choices = random.choices
+        tokens_per_row = width // 3
+
+        # create raining animation; each row is one choices() call
+        # over the precomputed tokens instead of two randint calls
+        # and a string concat per token
+        for _ in range(frames):
+            rain_animation = [
+                "".join(choices(_RAIN_TOKENS, k=tokens_per_row))[:width]
+                for _ in range(height - 1)
+            ]
+
+            # one write per frame
+            sys.stdout.write("\n".join(rain_animation) + "\n")
+            sys.stdout.flush()
+            time.sleep(0.5)
+            Ui.clear_terminal()
+
+        running_animation = False
@@ -2,24 +2,98 @@
 
 from __future__ import annotations
 import random
-import os
+from array import array
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
-from combatgame.skills import Skills, BaseSkill, SkillEffects
-from combatgame.utils.utils import csv_to_dict
-from combatgame.resources.ascii_art import ascii_arts
+from combatgame.skills import (
+    BaseSkill, SkillEffects, SkillUnavailable,
+    WhiskerGuard, ClawSwipe, IllusionaryAura, ReflectiveShield,
+    HealingPurr, LuckyCharm, PurrfectStrike, CripplingStrike,
+)
+from combatgame._kernels import compute_damage
+
+# typed rows generated from data/job_class_attributes.csv by
+# scripts/gen_stat_tables.py, so startup skips CSV parsing entirely
+from combatgame._stat_tables_gen import JOB_STATS as _JOB_STATS
 
 if TYPE_CHECKING:
     from combatgame.enemies import EnemyCharacter
 
-# get directory of this file
-this_file_dir = os.path.dirname(os.path.abspath(__file__))
+# hoisted reference to the shared Random instance's random(), saving a
+# module attribute lookup on every crit roll
+_random = random.random
+
+
+@lru_cache(maxsize=None)
+def _format_cost_error(points_type: str, cost: int, available: int) -> str:
+    """Format (and memoize) the not-enough-points log line.
 
-# get job_classes_attributes.csv file path
-job_class_attributes_path = f"{this_file_dir}/data/job_class_attributes.csv"
+    Parameters
+    ----------
+    points_type : str
+        Which points were missing ("speed" or "magic").
+    cost : int
+        The amount of points the skill costs.
+    available : int
+        The amount of points the character has.
+    """
 
-# convert job_classes_attributes.csv file to python dictionary
-job_class_attributes = csv_to_dict(job_class_attributes_path, "job")
+    return f"Not enough {points_type} points. You need {cost} but only " \
+        f"have {available}."
+
+class _LazyAsciiArts:
+    """Lazy accessor for the ascii art resource.
+
+    Defers importing combatgame.resources.ascii_art until the first art
+    lookup, so importing this module doesn't pull every art into memory.
+    """
+
+    __slots__ = ("_arts",)
+
+    def __init__(self):
+        self._arts = None
+
+    def __getitem__(self, key):
+        if self._arts is None:
+            # pylint: disable=import-outside-toplevel
+            from combatgame.resources.ascii_art import ascii_arts as arts
+            self._arts = arts
+
+        return self._arts[key]
+
+
+# behaves like the ascii_arts dict, but only loads the resource on first use
+ascii_arts = _LazyAsciiArts()
+
+# compact typed stat rows for the batch simulation path: one array("i")
+# of [HP, MAX_HP, AP, DP, MAX_DP, SP, LUCK] per job (the _kernels
+# layout), indexable by job via JOB_INDEX
+JOB_INDEX = {job: index for index, job in enumerate(_JOB_STATS)}
+JOB_STATS_ROWS = tuple(
+    array("i", (
+        attr["HP"], attr["HP"], attr["AP"],
+        attr["DP"], attr["DP"], attr["SP"], attr["Luck"],
+        ))
+    for attr in _JOB_STATS.values()
+)
+
+# skill classes per job class, used by BaseCharacter.__init__ so the job
+# subclasses don't each carry their own construction logic
+JOB_SKILLS = {
+    "Tank": (WhiskerGuard, ClawSwipe),
+    "MirrorMage": (IllusionaryAura, ReflectiveShield),
+    "Healer": (HealingPurr, LuckyCharm),
+    "Assassin": (PurrfectStrike, CripplingStrike),
+}
+
+# display names per job class
+JOB_DISPLAY = {
+    "Tank": "Tank",
+    "MirrorMage": "Mirror Mage",
+    "Healer": "Healer",
+    "Assassin": "Assassin",
+}
 
 
 class BaseCharacter:
@@ -59,6 +133,34 @@ class BaseCharacter:
 
     # pylint: disable=too-many-instance-attributes
 
+    # class-level marker for the combat display: player characters have
+    # magic/effects/skills panels, enemies override this to False
+    is_player = True
+
+    # fixed attribute slots so instances skip the per-object __dict__,
+    # making attribute access faster in the combat loops
+    __slots__ = (
+        "name",
+        "health_points",
+        "attack_points",
+        "defense_points",
+        "speed_points",
+        "magic_points",
+        "job_class",
+        "luck",
+        "skills",
+        "active_effects",
+        "character_image",
+        "ascii_art",
+        "starting_column_position",
+        "max_health_points",
+        "max_defense_points",
+        "effects_version",
+        "_effects_str_version",
+        "_effects_str_cache",
+        "_skills_str_cache",
+    )
+
     def __init__(self, name: str, job_class: str = None):
         """Initializes a character instance.
 
@@ -85,8 +187,18 @@ class BaseCharacter:
         # character's job class skills
         self.skills = []
 
-        # active effects from using skills
-        self.active_effects = []
+        # active effects from using skills, keyed by effect class
+        self.active_effects = {}
+
+        # display caches for effects_display/skills_display: the joined
+        # effect string is rebuilt only when effects_version moves past
+        # _effects_str_version (bumped at every effect add/remove); the
+        # skills list never changes after init, so its string is built
+        # at most once
+        self.effects_version = 0
+        self._effects_str_version = -1
+        self._effects_str_cache = ""
+        self._skills_str_cache = None
 
         # character's image
         self.character_image = ""
@@ -101,6 +213,48 @@ class BaseCharacter:
         if job_class:
             self._assign_job_class_attributes(job_class)
 
+            # initialize skills from the job class skill table
+            skill_classes = JOB_SKILLS.get(job_class)
+            if skill_classes:
+                self.skills = [skill_class() for skill_class in skill_classes]
+
+    def effects_display(self) -> str:
+        """Return the joined active effects string for the combat UI.
+
+        The joined string is rebuilt only when effects_version says the
+        effects changed since it was last built.
+
+        Returns
+        -------
+        str : The comma-separated active effect names.
+        """
+
+        if self._effects_str_version != self.effects_version:
+            self._effects_str_cache = ', '.join(
+                str(effect) for effect in self.active_effects.values()
+                )
+            self._effects_str_version = self.effects_version
+
+        return self._effects_str_cache
+
+    def skills_display(self) -> str:
+        """Return the joined skill names string for the combat UI.
+
+        The skills list is fixed after init, so the joined string is
+        built at most once per character.
+
+        Returns
+        -------
+        str : The comma-separated skill names.
+        """
+
+        if self._skills_str_cache is None:
+            self._skills_str_cache = ', '.join(
+                str(skill.name) for skill in self.skills
+                )
+
+        return self._skills_str_cache
+
     def _assign_job_class_attributes(self, job_class_name: str) -> None:
         """Assign job class attributes from job_classes_attributes.csv.
 
@@ -110,14 +264,14 @@ class BaseCharacter:
             The name of the job class.
         """
 
-        attr = job_class_attributes[job_class_name]
+        attr = _JOB_STATS[job_class_name]
         self.job_class = job_class_name
-        self.max_health_points: int = int(attr["HP"])
-        self.max_defense_points: int = int(attr["DP"])
-        self.attack_points: int = int(attr["AP"])
-        self.speed_points: int = int(attr["SP"])
-        self.magic_points: int = int(attr["MP"])
-        self.luck: int = int(attr["Luck"])
+        self.max_health_points: int = attr["HP"]
+        self.max_defense_points: int = attr["DP"]
+        self.attack_points: int = attr["AP"]
+        self.speed_points: int = attr["SP"]
+        self.magic_points: int = attr["MP"]
+        self.luck: int = attr["Luck"]
         self.ascii_art = ascii_arts[job_class_name]
 
         self.health_points: int = self.max_health_points
@@ -141,11 +295,10 @@ class BaseCharacter:
         SkillEffects : The effect object if effect is in self.active_effects, None otherwise.
         """
 
-        # checks if there is an active_effects attribute
-        if hasattr(self, "active_effects"):
-            return next((item for item in self.active_effects if isinstance(item, effect)), None)
-
-        return None
+        # active_effects is keyed by effect class, so this is a single
+        # dict lookup instead of a linear isinstance scan; every
+        # character (enemies included) always has the dict
+        return self.active_effects.get(effect)
 
     def basic_attack(self, target: BaseCharacter) -> str:
         """Deals basic attack to target.
@@ -161,7 +314,12 @@ class BaseCharacter:
             The log of using basic attack.
         """
 
-        total_damage = 0
+        # hoist repeatedly-read attributes into locals to cut down on
+        # attribute lookups in this hot path
+        name = self.name
+        target_name = target.name
+        attack_points = self.attack_points
+
         log = ""
 
         # reduce speed points by 1
@@ -171,7 +329,7 @@ class BaseCharacter:
         if effect := target.get_active_effect(SkillEffects.Invincible):
 
             # the log to return
-            log = f"{self.name}'s attack was REJECTED due to {target.name}'s" + \
+            log = f"{name}'s attack was REJECTED due to {target_name}'s" + \
                 f" {effect.belongs_to}."
 
             # reduce the use count of the effect
@@ -179,42 +337,40 @@ class BaseCharacter:
 
             # remove effect if its used up
             if effect.use_count <= 0:
-                target.active_effects.remove(effect)
+                del target.active_effects[SkillEffects.Invincible]
+                target.effects_version += 1
 
             return log
 
         # checks if target has reflective shield effect and assigns effect to the return value
         if effect := target.get_active_effect(SkillEffects.ReflectiveShield):
-            log = effect.take_effect(self, self.attack_points)
+            log = effect.take_effect(self, attack_points)
 
             # reduce the use count of the effect
             effect.use_count -= 1
 
             # remove effect if its used up
             if effect.use_count == 0:
-                target.active_effects.remove(effect)
+                del target.active_effects[SkillEffects.ReflectiveShield]
+                target.effects_version += 1
 
             return log
 
         # calculates chances of critical hit based on job class's luck
-        # critical hits ignores target's defense points and reduces their HP
-        # by the amount of attacker's AP
-        critical_hit = (random.randint(1, 100)) <= self.luck
-
         # critical hits ignores target's defense points and reduces their HP
         # by double the amount of attacker's AP
+        total_damage, critical_hit = compute_damage(
+            attack_points, target.defense_points, self.luck, _random() * 100.0
+            )
+
         if critical_hit:
-            total_damage = 2 * self.attack_points
-            log = f"{self.name} lands a CRITICAL hit and dealt {total_damage}HP on {target.name}!"
+            log = f"{name} lands a CRITICAL hit and dealt {total_damage}HP on {target_name}!"
 
-        else:
-            # if target's defense points is more than atttackers's AP no damage
-            # is dealt
-            total_damage = max(self.attack_points - target.defense_points, 0)
-            log = f"{self.name} attacked {target.name}, dealing {total_damage}HP."
+        elif total_damage == 0:
+            log = f"{name} tried attacking {target_name} but cant get through its defense!"
 
-            if total_damage == 0:
-                log = f"{self.name} tried attacking {target.name} but cant get through its defense!"
+        else:
+            log = f"{name} attacked {target_name}, dealing {total_damage}HP."
 
         # deducts target's health points by total_damage
         target.health_points -= total_damage
@@ -259,21 +415,20 @@ class BaseCharacter:
             The log for checking skill cost.
         """
 
-        # not enough speed points
-        if self.speed_points < skill.speed_points_cost:
-            log = f"Not enough speed points. You need {skill.speed_points_cost} but only " \
-                f"have {self.speed_points}."
-
-            return False, log
+        speed_points = self.speed_points
+        magic_points = self.magic_points
 
-        # not enough magic points
-        if self.magic_points < skill.magic_points_cost:
-            log = f"Not enough magic points. You need {skill.magic_points_cost} but only " \
-                f"have {self.magic_points}."
+        # fast path: both costs covered, no string work at all
+        if speed_points >= skill.speed_points_cost and \
+                magic_points >= skill.magic_points_cost:
+            return True, ""
 
-            return False, log
+        # not enough speed points
+        if speed_points < skill.speed_points_cost:
+            return False, _format_cost_error("speed", skill.speed_points_cost, speed_points)
 
-        return True, ""
+        # not enough magic points
+        return False, _format_cost_error("magic", skill.magic_points_cost, magic_points)
 
     def use_skill(self, skill_index: int, target: "EnemyCharacter" = None):
         """Use a skill.
@@ -288,7 +443,13 @@ class BaseCharacter:
 
         Returns
         -------
+        log : str
+            The log for using the skill.
 
+        Raises
+        ------
+        SkillUnavailable
+            If the character lacks the points to use the skill.
         """
 
         # check if skill_index is valid
@@ -304,7 +465,7 @@ class BaseCharacter:
 
         # handle skill not available
         if not is_available:
-            return is_available, log
+            raise SkillUnavailable(log)
 
         # process the skill
 
@@ -332,6 +493,12 @@ class BaseCharacter:
         """
         return self.health_points > 0
 
+    def __str__(self):
+        return JOB_DISPLAY.get(self.job_class) or self.__class__.__name__
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(\'{self.name}\')"
+
 
 class Tank(BaseCharacter):
     """Represents a Tanker player character.
@@ -343,22 +510,11 @@ class Tank(BaseCharacter):
 
     """
 
-    def __init__(self, name: str):
-
-        # get job class type
-        job_class = self.__class__.__name__
-
-        # initialize attributes of BaseCharacter class
-        super().__init__(name, job_class)
-
-        # initialize skills to job class
-        self.skills = [Skills.WhiskerGuard(), Skills.ClawSwipe()]
-
-    def __str__(self):
-        return "Tank"
+    __slots__ = ()
 
-    def __repr__(self):
-        return f"{self.__class__.__name__}(\'{self.name}\')"
+    def __init__(self, name: str):
+        # attributes and skills come from the job class tables
+        super().__init__(name, self.__class__.__name__)
 
 
 class MirrorMage(BaseCharacter):
@@ -371,22 +527,11 @@ class MirrorMage(BaseCharacter):
 
     """
 
-    def __init__(self, name: str):
-
-        # get job class type
-        job_class = self.__class__.__name__
+    __slots__ = ()
 
-        # initialize attributes of BaseCharacter class
-        super().__init__(name, job_class)
-
-        # initialize skills to job class
-        self.skills = [Skills.IllusionaryAura(), Skills.ReflectiveShield()]
-
-    def __str__(self):
-        return "Mirror Mage"
-
-    def __repr__(self):
-        return f"{self.__class__.__name__}(\'{self.name}\')"
+    def __init__(self, name: str):
+        # attributes and skills come from the job class tables
+        super().__init__(name, self.__class__.__name__)
 
 
 class Healer(BaseCharacter):
@@ -399,22 +544,11 @@ class Healer(BaseCharacter):
 
     """
 
-    def __init__(self, name: str):
-
-        # get job class type
-        job_class = self.__class__.__name__
-
-        # initialize attributes of BaseCharacter class
-        super().__init__(name, job_class)
+    __slots__ = ()
 
-        # initialize skills to job class
-        self.skills = [Skills.HealingPurr(), Skills.LuckyCharm()]
-
-    def __str__(self):
-        return "Healer"
-
-    def __repr__(self):
-        return f"{self.__class__.__name__}(\'{self.name}\')"
+    def __init__(self, name: str):
+        # attributes and skills come from the job class tables
+        super().__init__(name, self.__class__.__name__)
 
 
 class Assassin(BaseCharacter):
@@ -427,19 +561,8 @@ class Assassin(BaseCharacter):
 
     """
 
-    def __init__(self, name: str):
-
-        # get job class type
-        job_class = self.__class__.__name__
-
-        # initialize attributes of BaseCharacter class
-        super().__init__(name, job_class)
-
-        # initialize skills to job class
-        self.skills = [Skills.PurrfectStrike(), Skills.CripplingStrike()]
+    __slots__ = ()
 
-    def __str__(self):
-        return "Assassin"
-
-    def __repr__(self):
-        return f"{self.__class__.__name__}(\'{self.name}\')"
+    def __init__(self, name: str):
+        # attributes and skills come from the job class tables
+        super().__init__(name, self.__class__.__name__)
@@ -1,23 +1,27 @@
 """Classes implementation for enemies with their attributes."""
-import os
-from functools import partial
+from array import array
 
-from combatgame.characters import BaseCharacter
-from combatgame.resources.ascii_art import ascii_arts
-from combatgame.utils.utils import csv_to_dict
+from combatgame.characters import BaseCharacter, ascii_arts
 
+# typed rows generated from data/enemy_attributes.csv by
+# scripts/gen_stat_tables.py, so startup skips CSV parsing entirely
+from combatgame._stat_tables_gen import ENEMY_STATS as _ENEMY_STATS
 
-# get directory of this file
-this_file_dir = os.path.dirname(os.path.abspath(__file__))
-
-# get enemy_attributes.csv file path
-enemy_attributes_path = f"{this_file_dir}/data/enemy_attributes.csv"
-
-# convert enemy_attributes.csv file to python dictionary
-enemy_attributes = csv_to_dict(enemy_attributes_path, "name")
 
 # gets all available enemy names
-enemy_names = enemy_attributes.keys()
+enemy_names = _ENEMY_STATS.keys()
+
+# compact typed stat rows for the batch simulation path: one array("i")
+# of [HP, MAX_HP, AP, DP, MAX_DP, SP, LUCK] per enemy (the _kernels
+# layout), indexable by name via ENEMY_INDEX
+ENEMY_INDEX = {name: index for index, name in enumerate(_ENEMY_STATS)}
+ENEMY_STATS_ROWS = tuple(
+    array("i", (
+        attr["HP"], attr["HP"], attr["AP"],
+        attr["DP"], attr["DP"], attr["SP"], attr["Luck"],
+        ))
+    for attr in _ENEMY_STATS.values()
+)
 
 class EnemyCharacter(BaseCharacter):
     """Represents an enemy character.
@@ -36,22 +40,28 @@ class EnemyCharacter(BaseCharacter):
     luck : int
     """
 
+    __slots__ = ()
+
+    # enemies have no magic/effects/skills panels in the combat display
+    is_player = False
+
     def __init__(self, name):
         # initialize parent class attributes
         super().__init__(name)
 
-        # deletes magic points and skills since enemies do not have these
+        # deletes magic points and skills since enemies do not have these;
+        # active_effects stays as the empty dict set by BaseCharacter so
+        # effect lookups work without attribute checks
         del self.magic_points
         del self.skills
-        del self.active_effects
 
         # initialize attributes
-        attr = enemy_attributes[name]
-        self.max_health_points: int = int(attr["HP"])
-        self.max_defense_points: int = int(attr["DP"])
-        self.attack_points: int = int(attr["AP"])
-        self.speed_points: int = int(attr["SP"])
-        self.luck: int = int(attr["Luck"])
+        attr = _ENEMY_STATS[name]
+        self.max_health_points: int = attr["HP"]
+        self.max_defense_points: int = attr["DP"]
+        self.attack_points: int = attr["AP"]
+        self.speed_points: int = attr["SP"]
+        self.luck: int = attr["Luck"]
         self.ascii_art = ascii_arts[name]
 
         self.health_points: int = self.max_health_points
@@ -73,20 +83,26 @@ class EnemyCharacter(BaseCharacter):
 
     def select_action(self, active_player: BaseCharacter):
         """Select the best action based on a rule-based approach.
-        
+
         Parameters
         ----------
         active_player : BaseCharacter
             The active player character.
+
+        Returns
+        -------
+        tuple : A (method, args) pair for the chosen action. Returning the
+            bound method and its arguments avoids allocating a
+            functools.partial every turn.
         """
 
         if (active_player.health_points + active_player.defense_points) < self.attack_points:
-            return partial(self.basic_attack, active_player)
+            return self.basic_attack, (active_player,)
 
         if self.health_points < (0.2 * self.max_health_points):
-            return self.heal
+            return self.heal, ()
 
         if self.defense_points < (0.5 * self.max_defense_points):
-            return self.defend
+            return self.defend, ()
 
-        return partial(self.basic_attack, active_player)
+        return self.basic_attack, (active_player,)
@@ -2,13 +2,14 @@
 from typing import List, Union
 import random
 import time
-from datetime import datetime
 from functools import partial
 from collections import deque
 
 from combatgame.characters import BaseCharacter, Tank, MirrorMage, Healer, Assassin
 from combatgame.enemies import EnemyCharacter
+from combatgame.skills import SkillUnavailable
 from combatgame.ui import Ui
+from combatgame.menus import Menu
 
 
 class GameManager:
@@ -44,6 +45,7 @@ class GameManager:
         self,
         player_characters: List[Union[Tank, MirrorMage, Healer, Assassin]],
         enemies: List[EnemyCharacter],
+        headless: bool = False,
     ):
         """Initializes a GameManager instance.
 
@@ -56,23 +58,114 @@ class GameManager:
     enemies : List[EnemyCharacter]
         A list of enemy characters participating in the game. Each enemy character is an instance
         of the EnemyCharacter class.
+
+    headless : bool
+        If True, skip all rendering, delays and battle log formatting.
+        Intended for running many battles programmatically. Defaults to False.
         """
 
         self.player_characters = player_characters
         self.enemies = enemies
 
+        # headless mode: no rendering, no delays, no log formatting
+        self.headless = headless
+        self._log_enabled = not headless
+
         # assign first character in player_characters as the active character
         self.active_player_character = player_characters[0]
 
         # assign first character in enemies as the active character
         self.active_enemy_character = enemies[0]
 
+        # liveness bitmasks (bit i set if the i-th team member is alive),
+        # kept up to date in handle_defeated_character so the win/lose
+        # checks don't rescan every character each turn
+        self._alive_players = sum(
+            1 << index for index, character in enumerate(player_characters)
+            if character.is_alive()
+        )
+        self._alive_enemies = sum(
+            1 << index for index, character in enumerate(enemies)
+            if character.is_alive()
+        )
+
         # assign turn character
         self.turn_character = self.determine_turn_order()
 
         # battle log (limits to 5 items only)
         self.battle_log = deque(maxlen=5)
 
+        # cache of action menus keyed by (id(player), id(enemy)) so the
+        # options dict and Menu aren't rebuilt every turn; a switch or
+        # defeat changes the key, so stale menus are never reused
+        self._action_menu_cache = {}
+
+        # cache for the formatted battle log timestamp (see _timestamp)
+        self._last_timestamp_second = -1
+        self._last_timestamp_str = ""
+
+    def set_enemies(self, enemies: List[EnemyCharacter]):
+        """Swap in a new group of enemies and reset per-combat state.
+
+        Lets one GameManager instance be reused across combats instead
+        of constructing a new one per scene.
+
+        Parameters
+        ----------
+        enemies : List[EnemyCharacter]
+            The enemy characters for the next combat.
+        """
+
+        self.enemies = enemies
+        self.active_enemy_character = enemies[0]
+
+        # rebuild both liveness masks: the enemies are new and the
+        # player characters' health may have changed between combats
+        self._alive_enemies = sum(
+            1 << index for index, character in enumerate(enemies)
+            if character.is_alive()
+        )
+        self._alive_players = sum(
+            1 << index for index, character in enumerate(self.player_characters)
+            if character.is_alive()
+        )
+
+        # keep the current active player if still alive, otherwise pick
+        # the first alive one
+        if not self.active_player_character.is_alive() and self._alive_players:
+            index = (self._alive_players & -self._alive_players).bit_length() - 1
+            self.active_player_character = self.player_characters[index]
+
+        self.turn_character = self.determine_turn_order()
+
+        # per-combat caches don't carry over
+        self.battle_log.clear()
+        self._action_menu_cache.clear()
+
+    def _timestamp(self) -> str:
+        """Return the current "HH:MM:SS - " battle log prefix.
+
+        Returns
+        -------
+        str : The formatted timestamp prefix.
+
+        Notes
+        -----
+        The formatted string is cached per second, since multiple log
+        entries can land within the same second and strftime-style
+        formatting is comparatively expensive.
+        """
+
+        now = int(time.time())
+
+        if now != self._last_timestamp_second:
+            self._last_timestamp_second = now
+            local = time.localtime(now)
+            self._last_timestamp_str = \
+                f"{local.tm_hour:02d}:{local.tm_min:02d}:{local.tm_sec:02d} - "
+
+        return self._last_timestamp_str
+
     def start_combat(self):
         """Start the combat.
         
@@ -85,8 +178,10 @@ class GameManager:
         while not self.is_game_over():
             self.run_battle_logic()
 
-        Ui.clear_terminal()
+        if self.headless:
+            return self.player_won()
 
+        # the frame diffing in display_combat_screen handles clearing
         Ui.display_combat_screen(
             self.active_player_character, self.active_enemy_character, self.battle_log
             )
@@ -100,79 +195,98 @@ class GameManager:
         input("Press enter to continue...")
         return player_won
 
-    def run_battle_logic(self, flag: bool=False):
-        """The logic implementation for the combat battle.
-        
-        Parameters
-        ----------
-        flag : bool
-            If function is running within itself.
-        """
+    def run_battle_logic(self):
+        """The logic implementation for the combat battle."""
         # get active characters
         player = self.active_player_character
         enemy = self.active_enemy_character
 
-        # turn character doesnt change if flag is True
-        if not flag:
-            # set the turn order character
-            self.turn_character = self.determine_turn_order()
+        # set the turn order character
+        self.turn_character = self.determine_turn_order()
 
-        Ui.clear_terminal()
-        Ui.display_combat_screen(player, enemy, self.battle_log)
+        if not self.headless:
+            Ui.display_combat_screen(player, enemy, self.battle_log)
 
         if player is self.turn_character:
             # lets player know its their turn
-            print("\nIt's your turn!")
-
-            # define dictionary of available player options for Menu
-            available_player_options = {
-                "Attack": partial(player.basic_attack, enemy),
-                "Heal": player.heal
-            }
-
-            # add skills options to available_player_options dict
-            for index, skill in enumerate(player.skills):
-                available_player_options[f"{skill.name} (skill)"] = partial(
-                    player.use_skill,
-                    index,
-                    enemy
+            if not self.headless:
+                print("\nIt's your turn!")
+
+            cache_key = (id(player), id(enemy))
+            select_action_menu = self._action_menu_cache.get(cache_key)
+
+            if select_action_menu is None:
+                # define dictionary of available player options for Menu
+                available_player_options = {
+                    "Attack": partial(player.basic_attack, enemy),
+                    "Heal": player.heal
+                }
+
+                # add skills options to available_player_options dict
+                for index, skill in enumerate(player.skills):
+                    available_player_options[f"{skill.name} (skill)"] = partial(
+                        player.use_skill,
+                        index,
+                        enemy
+                        )
+
+                # add the option to switch active characters
+                available_player_options["Switch characters"] = \
+                    self.switch_active_player_characters
+
+                # create the menu and cache it for later turns
+                select_action_menu = Menu("Choose an Action", available_player_options)
+                self._action_menu_cache[cache_key] = select_action_menu
+
+            # retry loop: an unavailable skill logs the reason and lets
+            # the player pick again without recursing into this method
+            while True:
+                # let user select their action; headless games read the
+                # choice without rendering the menu
+                selected_action = select_action_menu.select_option(
+                    invalid_handler=self.invalid_option_handler,
+                    display=not self.headless
                     )
+                # get current time
+                current_time = self._timestamp() if self._log_enabled else ""
 
-            # add the option to switch active characters
-            available_player_options["Switch characters"] = self.switch_active_player_characters
+                try:
+                    # success and combat log
+                    log = selected_action()
 
-            # create the menu and let user select their action
-            select_action_menu = Ui.Menu("Choose an Action", available_player_options)
-            selected_action = select_action_menu.select_option(
-                invalid_handler=self.invalid_option_handler
-                )
-            # get current time
-            current_time = datetime.now().strftime("%H:%M:%S - ")
+                except SkillUnavailable as error:
+                    if self._log_enabled:
+                        self.battle_log.append(str(error))
 
-            # success and combat log
-            log = selected_action()
+                    # redraw the combat screen before asking again
+                    if not self.headless:
+                        Ui.display_combat_screen(player, enemy, self.battle_log)
+                        print("\nIt's your turn!")
+                    continue
 
-            # tuple is returned only when there's an error using skill
-            if isinstance(log, tuple):
-                self.battle_log.append(log[1])
-                return self.run_battle_logic(flag=True)
+                break
 
-            self.battle_log.append(current_time + log)
+            if self._log_enabled:
+                self.battle_log.append(current_time + log)
 
-            if selected_action != available_player_options["Switch characters"]:
+            if selected_action != self.switch_active_player_characters:
                 # update idle character's stat (enemy)
                 self.update_idle_character_stats(enemy)
 
         else:
             # lets player know its enemy's turn
-            print(f"\nIt's {enemy.name} turn.")
-            enemy_action = enemy.select_action(player)
+            if not self.headless:
+                print(f"\nIt's {enemy.name} turn.")
+
+            enemy_action, enemy_action_args = enemy.select_action(player)
 
-            # get current time
-            current_time = datetime.now().strftime("%H:%M:%S - ")
-            self.battle_log.append(current_time + enemy_action())
+            log = enemy_action(*enemy_action_args)
 
-            time.sleep(2)
+            if self._log_enabled:
+                self.battle_log.append(self._timestamp() + log)
+
+            if not self.headless:
+                time.sleep(2)
 
             # update idle character's stat (player)
             self.update_idle_character_stats(player)
@@ -196,24 +310,31 @@ class GameManager:
             The defeated character's opponent.
         """
 
-        current_time = datetime.now().strftime("%H:%M:%S - ")
-
         character.health_points = 0
-        self.battle_log.append(
-                current_time + f"{character.name} has been defeated by {opponent.name}!"
+
+        if self._log_enabled:
+            self.battle_log.append(
+                self._timestamp() +
+                f"{character.name} has been defeated by {opponent.name}!"
                 )
 
+        # clear the defeated character's bit in its team's liveness mask
+        if isinstance(character, EnemyCharacter):
+            self._alive_enemies &= ~(1 << self.enemies.index(character))
+        else:
+            self._alive_players &= ~(1 << self.player_characters.index(character))
+
         if not self.is_game_over():
-            # checks if its a player or enemy character that is defeated
+            # checks if its a player or enemy character that is defeated,
+            # then picks the lowest set bit of the mask as the next
+            # active character
             if isinstance(character, EnemyCharacter):
-                self.active_enemy_character = next(
-                    character for character in self.enemies if character.is_alive()
-                )
+                index = (self._alive_enemies & -self._alive_enemies).bit_length() - 1
+                self.active_enemy_character = self.enemies[index]
                 return
 
-            self.active_player_character = next(
-                    character for character in self.player_characters if character.is_alive()
-                )
+            index = (self._alive_players & -self._alive_players).bit_length() - 1
+            self.active_player_character = self.player_characters[index]
 
     @staticmethod
     def update_idle_character_stats(idle_character: BaseCharacter):
@@ -238,7 +359,6 @@ class GameManager:
 
         print("Invalid choice. Please choose again.")
         time.sleep(1)
-        Ui.clear_terminal()
         Ui.display_combat_screen(
             self.active_player_character, self.active_enemy_character, self.battle_log
             )
@@ -275,24 +395,22 @@ class GameManager:
 
             return result
 
-        Ui.clear_terminal()
+        if not self.headless:
+            Ui.clear_terminal()
 
         # craete the character switch menu dictionary
         available_characters_dict = create_available_characters_dict()
 
         # create menu for character switch options
-        character_switch_menu = Ui.Menu("Switch Active Characters", available_characters_dict)
+        character_switch_menu = Menu("Switch Active Characters", available_characters_dict)
 
         # old active character
         old_active_character = self.active_player_character
 
         # get chosen character
         chosen_character = character_switch_menu.select_option(
-            invalid_handler=partial(
-                GameManager.invalid_option_handler,
-                self.active_player_character,
-                self.active_enemy_character
-                )
+            invalid_handler=self.invalid_option_handler,
+            display=not self.headless
             )
 
         # makes sure selected character is alive
@@ -319,21 +437,19 @@ class GameManager:
         characters have same speed points
         """
 
-        # stores active player and enemy characters in a list
-        active_characters = [self.active_enemy_character,
-                             self.active_player_character]
-
-        # sorts active_characters by speed points in descending order
-        # if both active characters have the same speed_points,
-        # randomize the sort order
-        sorted_entities = sorted(
-            active_characters,
-            key=lambda entity: (entity.speed_points, random.random()),
-            reverse=True,
-        )
+        player = self.active_player_character
+        enemy = self.active_enemy_character
+
+        # compare speed points directly instead of building and sorting
+        # a list every turn
+        if player.speed_points > enemy.speed_points:
+            return player
+
+        if enemy.speed_points > player.speed_points:
+            return enemy
 
-        # returns the character for the turn
-        return sorted_entities[0]
+        # randomize the turn on a speed tie
+        return player if random.getrandbits(1) else enemy
 
     def is_game_over(self) -> bool:
         """Check the win/lose conditions of the game.
@@ -345,8 +461,7 @@ class GameManager:
         """
 
         # returns True if all player or enemy characters are defeated, False otherwise.
-        return not any(character.is_alive() for character in self.player_characters) \
-            or not any(character.is_alive() for character in self.enemies)
+        return self._alive_players == 0 or self._alive_enemies == 0
 
     def player_won(self):
         """Returns True if game ended and player won, False otherwise.
@@ -365,5 +480,4 @@ class GameManager:
             return False
 
         # checks if all enemies are dead and at least one character is alive
-        return any(character.is_alive() for character in self.player_characters) \
-            and not any(character.is_alive() for character in self.enemies)
+        return self._alive_players != 0 and self._alive_enemies == 0
@@ -0,0 +1,257 @@
+"""
+Menu Module
+===========
+
+This module contains the UI menu used across the game screens.
+
+"""
+
+import sys
+import time
+from typing import Dict, Callable
+
+from combatgame.animations import Animation
+from combatgame.ui import Ui, _hborder
+
+
+class Menu:
+    """Represents a UI Menu.
+
+        Attributes
+        ----------
+        title : str
+            The title of the menu.
+        _displays : list of str
+            The display text of each option, in menu order.
+        _returns : list
+            The corresponding return values, in the same order.
+        """
+
+    def __init__(self, title: str, options_dict: Dict):
+        """Initialize a UI Menu instance.
+
+            Parameters
+            ----------
+            title : str
+                The title of the menu.
+            options_dict : Dict
+                A dictionary where the key represents the display text of each option, and the
+                values represent the corresponding return values.
+            """
+        # rendering cache, kept in sync by set_title/set_options
+        # and _render
+        self._rendered = None
+        self._render_padding = None
+
+        self.set_title(title)
+        self.set_options(options_dict)
+
+    def set_title(self, title: str):
+        """Set the menu title, so one Menu can be reused.
+
+            Parameters
+            ----------
+            title : str
+                The new title of the menu.
+            """
+
+        self.title = title
+
+        # the cached rendering no longer matches
+        self._rendered = None
+
+    def set_options(self, options_dict: Dict):
+        """Replace the menu options, so one Menu can be reused.
+
+            Parameters
+            ----------
+            options_dict : Dict
+                A dictionary where the key represents the display text of each option, and the
+                values represent the corresponding return values.
+            """
+
+        # parallel lists: the option at menu number n lives at
+        # index n - 1 in both, so lookups are one list index
+        # instead of two dict accesses
+        self._displays = list(options_dict.keys())
+        self._returns = list(options_dict.values())
+
+        # set the last menu option to be quit
+        self._displays.append("Quit")
+        self._returns.append("Quit")
+
+        # the cached rendering no longer matches
+        self._rendered = None
+
+    def update_label(self, index: int, display: str):
+        """Change one option's display text in place.
+
+            Cheaper than set_options when only a label changes (e.g. a
+            toggle flipping between On and Off): the return values and
+            option order are untouched.
+
+            Parameters
+            ----------
+            index : int
+                The zero-based index of the option to relabel.
+            display : str
+                The new display text.
+            """
+
+        self._displays[index] = display
+
+        # the cached rendering no longer matches
+        self._rendered = None
+
+    def _render(self, padding: int):
+        """Build and cache the full menu box string.
+
+            Title and options are immutable between set_title and
+            set_options calls, so re-prompting on invalid input reuses
+            the cached string instead of rebuilding the box.
+
+            Parameters
+            ----------
+            padding : int
+                The number of spaces for padding around the menu content.
+            """
+
+        def wrap_string(string: str, wrapper: str):
+            # wrap a string with a given wrapper string.
+            return wrapper + string + wrapper
+
+        title_length = len(self.title)
+
+        # the length of the longest display string
+        max_display_length = max(len(str(display)) for display in self._displays)
+
+        # account for the numbering at the start of every option
+        max_display_length += 2
+
+        # if title_length more than or equals to max_display_length, box length will
+        # correspond to the title_length
+        if title_length >= max_display_length:
+            box_length = title_length + (padding * 2) + 2
+
+        # else, box length will correspond to the max_display_length
+        else:
+            box_length = max_display_length + (padding * 2) + 2
+
+        # the shared horizontal border, built once per box width
+        border = _hborder(box_length - 2)
+
+        # the lines in the menu display
+        menu_lines = []
+
+        # add the top border of the menu box
+        menu_lines.append(f"╔{border}╗")
+
+        # add the menu title with padding and wrap it with border
+        menu_lines.append(wrap_string(self.title.center(box_length - 2), "║"))
+
+        # add the middle border of the menu box
+        menu_lines.append(f"╠{border}╣")
+
+        # add each option with leading index and trailing whitespace for alignment
+        for index, display_text in enumerate(self._displays, start=1):
+
+            # format index and option
+            option_str =f"{index}. {display_text}"
+
+            # add trailling whitespace for alignment
+            formatted_option_str = f"{option_str:<{box_length-2}}"
+
+            # add formatted_option_str and wraps it with the box border
+            menu_lines.append(wrap_string(formatted_option_str, "║"))
+
+        # add the bottom border of the menu box
+        menu_lines.append(f"╚{border}╝")
+
+        # string combined with newline
+        self._rendered = "\n".join(menu_lines)
+        self._render_padding = padding
+
+    def display(self, padding: int = 5, print_line_by_line: bool=False):
+        """Display the UI Menu.
+
+            Parameters
+            ----------
+            padding : int, optional
+                The number of spaces for padding around the menu content (default is 5).
+            print_line_by_line : bool
+                Whether to print the menu line by line. Default to False.
+            """
+
+        # rebuild only when the title/options changed or a
+        # different padding is requested
+        if self._rendered is None or self._render_padding != padding:
+            self._render(padding)
+
+        if print_line_by_line:
+            Animation.print_line_by_line(self._rendered)
+
+        else:
+            print(self._rendered)
+
+
+    def select_option(
+        self,
+        print_line_by_line: bool=False,
+        invalid_handler: Callable=None,
+        display: bool=True
+        ):
+        """Select an option from the menu and return the chosen option.
+
+            Parameters
+            ----------
+            print_line_by_line : bool
+                Whether to print the menu line by line. Default to False.
+            invalid_handler : Callable
+                The function to run when an invalid option is given.
+            display : bool
+                Whether to print the menu and prompt before reading the
+                choice. Headless games pass False to read the choice
+                silently. Defaults to True.
+
+            Returns
+            -------
+            Any :
+                The value associated with the selected option.
+
+            """
+
+        # runs forever until a valid input is given
+        while True:
+            # display the menu
+            if display:
+                self.display(print_line_by_line=print_line_by_line)
+
+            # gets user input
+            choice = input("> " if display else "")
+
+            # checks if user input is valid
+            if choice.isdigit() and 1 <= int(choice) <= len(self._returns):
+                return_value = self._returns[int(choice) - 1]
+
+                # checks if Quit option is selected
+                if str(return_value).lower() == "quit":
+                    print("Quitting game...")
+
+                    # wait 1 second before exiting script
+                    time.sleep(1)
+                    sys.exit()
+
+                # return chosen option corresponding return value
+                return return_value
+
+            # check if invalid_handler is given
+            if invalid_handler:
+                invalid_handler()
+
+            else:
+                # auto handles invalid input by running itself again
+                print("Invalid choice. Please enter again.")
+
+                # clears terminal after 1 second
+                time.sleep(1)
+                Ui.clear_terminal()
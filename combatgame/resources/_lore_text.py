@@ -0,0 +1,158 @@
+"""This module contains the lore text."""
+
+from combatgame.resources.names import (
+    VIPERSTRIKE, DOOMSHROUD, WHISPERING_CAVERNS, MISTY_PEAKS
+)
+
+
+def _split_paragraphs(text: str) -> tuple:
+    """Split a lore block on the "|" paragraph separator."""
+    return tuple(text.split("|"))
+
+
+# every lore block is split into its paragraph tuple right where it is
+# defined, so displaying the static text never re-splits it; the outer
+# containers are tuples since they are never mutated
+START_GAME = (
+    _split_paragraphs(
+        """Once upon a time, in a far away land, there once existed a cozy little cat cafe that goes 
+by the name of “The Wildcat Cafe”. The cafe housed multifarious species of cats, each with their 
+own unique personalities and quirks. They lived a peaceful life, being pampered by the cafe’s 
+patrons.|One day, a mysterious virus broke out at the cat cafe, taking down every cat one by one. 
+The virus was relentless and deadly, causing nausea, fever, seizures and eventually death. The cafe 
+owners were left with no choice and hence, had to close down the cafe and release the remaining cats 
+back into the forest.|Left stranded in the wild, the cats were anxious and traumatized by the 
+catastrophe. They had to navigate through the forest fighting off potential predators, while also 
+trying to unravel the mystery of the sudden virus outbreak. 
+    """),
+
+    _split_paragraphs(
+        """Upon a discussion amongst the cats, they have decided to choose 
+{number_of_playable_characters} cat(s) to protect them from predators while the rest help in 
+navigation and finding clues to the mystery... 
+    """),
+)
+
+SCENE_ONE = (
+    _split_paragraphs(
+        f"""The chosen cat(s) stood strong, ready to fight off any predators to protect their
+companions. As they ventured deeper into the forest and the sun starts to set, The cats felt a
+sense of anticipation building within them, knowing that danger lurked in the shadows.|Without
+warning, a pair of glowing eyes formed in the shadows, fixated upon the cats with an unsettling
+intensity. With a sharp hiss, {VIPERSTRIKE}, a cunning serpent-like creature, slithered out from the
+tangled vines. Its venomous fangs dripped with a toxic substance, ready to strike at the first
+opportunity. The cats braced themselves, their fur standing on end, instinctively recognizing
+the imminent danger.
+    """),
+
+    _split_paragraphs(
+        f"""As {VIPERSTRIKE}'s menacing form lay defeated on the forest floor,"""
+        f""" the victorious cats shared a
+collective sigh of relief. Their courage and teamwork had triumphed over the formidable enemy.
+"""),
+)
+
+SCENE_TWO = _split_paragraphs(
+    f"""While the cats were about to venture deeper into the forest, Sage, a wise and
+knowledgable cat, discovered something unusual about {VIPERSTRIKE}. It was a peculiar mark on the
+serpent's scales — a symbol they had seen before.|It resembled a lowercase sigma symbol(σ), similar 
+to the emblem of the now-closed Wildcat Cafe. |This discovery left them puzzled, raising questions 
+about a potential connection between the cafe and the virus outbreak. Suspicion started to creep 
+into their minds. Was the cafe owner behind all these catastrophe?|The cats decided to not waste 
+any more time and continued venturing deeper into the forest finding for more clues...|
+Upon wandering into the forest, the cats were presented with three distinct paths that led deeper 
+into the forest. Each path held its own mysteries and potential clues to the virus outbreak and the 
+sigma symbol...""")
+
+SCENE_TWO_OPTION_ONE = (
+    _split_paragraphs(f"""The cats decided to descend into the depths of the {WHISPERING_CAVERNS}
+in hopes of uncovering more hints.|However, after exploring the caverns for awhile, they were met 
+with a dead end with no further hints to the mystery. Feeling disappointed and exhausted, they 
+searched for a cozy spot in the caverns to rest till morning. Zzzz. (Characters stats restored)
+"""),
+    _split_paragraphs(
+        f"""\"Wake up, wake up!\", Shadowpaw, the stealthy assassin cat,"""
+        f""" urgently whispered to his friends
+at 4 in the morning. Startled, the other cats shook off their drowsiness and gathered around 
+Shadowpaw, their eyes gleaming with curiosity.|"I sense danger nearby," Shadowpaw hissed, 
+his senses on high alert. "There's something lurking in the shadows. We must proceed with caution."
+Upon hearing Shadowpaw's urgent words, a wave of worry washed over the cats, instantly heightening 
+their senses and sharpening their focus.|As they proceeded, growling sounds, growing louder and 
+louder, could be heard echoing through the caverns. Suddenly, a bone-chilling howl pierced the air, 
+causing them to freeze in their tracks. Emerging from the shadows was {DOOMSHROUD}, a formidable and
+cunning wolf, its eyes gleaming with a fierce intensity. |The atmosphere grew tense as the two 
+parties locked eyes, each recognizing the strength and determination in the other. It was clear 
+that a battle of wits and agility was about to unfold, as the cats prepared themselves for a deadly 
+encounter with the cunning {DOOMSHROUD}.
+"""),
+
+    _split_paragraphs(
+        f"""Emerging victorious from the intense battle with {DOOMSHROUD},"""
+        f""" the cats embraced the sight of the
+rising sun. Determined not to waste another moment, they pressed forward towards their next
+destination: {MISTY_PEAKS}.|The towering mountains beckoned with an air of mystery, enticing the
+feline companions to embark on their next adventure. Curiosity ignited their spirits as they eagerly 
+anticipated the secrets that awaited them in the unexplored realm beyond.
+"""),
+)
+
+SCENE_TWO_OPTION_TWO = (_split_paragraphs(f"""{MISTY_PEAKS}: To Be Continued..."""),)
+
+SCENE_TWO_OPTION_THREE = (
+    _split_paragraphs(
+        """As the cats made their way along the Enchanted Meadow, they were greeted by a surreal and 
+ethereal landscape. Softly glowing flowers illuminated their path, casting a gentle radiance in 
+the moonlight.|Suddenly, the cats found themselves surrounded by a mesmerizing display of magical 
+fireflies. As the fireflies danced around them, they could feel their magic points replenishing, 
+empowering them for the challenges that lay ahead. (+10 magic points to all characters)|Despite 
+thorough exploration and diligent searching in the mystical surroundings, the cats found themselves 
+unable to uncover any tangible clues or hints. Undeterred by their lack of clues, the cats stood 
+strong and headed back to where they came from.|While making their way back through the forest, 
+a sudden change in the atmosphere signaled an approaching storm. A distant rumble echoed through 
+the trees, growing louder with each passing moment. The gentle rain turned into a torrential 
+downpour, accompanied by flashes of lightning that illuminated the surroundings with an eerie 
+glow."""),
+
+    _split_paragraphs(
+        f"""As the rain poured down outside, the cats sought refuge"""
+        f""" within the depths of the Whispering
+Caverns. Little did they know, their decision to seek shelter in the {WHISPERING_CAVERNS} would soon
+be filled with regret.|As the cats cautiously navigated through the dark and eerie Whispering
+Caverns, a pair of glowing eyes suddenly pierced through the shadows. {DOOMSHROUD}, the fearsome
+wolf, emerged, revealing its sharp fangs and menacing presence. The air grew heavy with tension 
+as the two parties locked eyes, readying themselves for a battle that would determine their fate 
+in this treacherous underground realm."""),
+
+    _split_paragraphs(
+        """Having taken refuge in the caverns until dawn,"""
+        """ the cats felt a renewed sense of purpose as the 
+first rays of sunlight pierced through the darkness. With their sights set on the enigmatic Misty 
+Peaks, a sense of anticipation and curiosity filled their hearts. What mysteries awaited them 
+beyond the towering mountains? The feline companions pondered this question, eager to uncover the 
+secrets that lay ahead."""),
+)
+
+SECOND_COMBAT_WIN = _split_paragraphs(
+    f"""With swift and coordinated strikes, the cats unleashed their combined
+strength upon {DOOMSHROUD}. The fierce wolf fought back with ferocity, but the cats' determination
+and skill proved to be unmatched. As the final blow landed, {DOOMSHROUD} let out a haunting howl
+before succumbing to defeat, its menacing presence vanquished.|The cats proceeded to investigate 
+the carcass of the wolf for any potential relation to the mystery, but to no avail. Doomshroud 
+was merely just a hungry, desperate wolf driven by the instinct to survive.
+""")
+
+
+PLAYER_LOST = _split_paragraphs(
+    """Despite their courage and determination, the cats succumbed to the relentless
+attacks. Their once-playful paws grew weak, their valiant hearts beat their final beats, and their
+spirits ascended to the starry sky above. The forest fell silent, as if mourning the loss of these
+brave feline warriors.
+""")
+
+
+# the player-count block formatted once per feasible count (1 to 3),
+# kept in paragraph-tuple form; index with count - 1
+START_GAME_1_BY_COUNT = tuple(
+    (START_GAME[1][0].format(number_of_playable_characters=count),)
+    for count in (1, 2, 3)
+)
@@ -111,4 +111,8 @@ ascii_arts = {
     r"      _/_|  | |",
     r"     (_/  \_)_)"
     ]
-}
\ No newline at end of file
+}
+
+# freeze every art as a tuple so all character instances share the same
+# immutable lines
+ascii_arts = {name: tuple(art) for name, art in ascii_arts.items()}
\ No newline at end of file
@@ -1,119 +1,43 @@
-"""This module contains the lore text."""
+"""Lazy accessor for the lore text.
 
-START_GAME = [
-    """Once upon a time, in a far away land, there once existed a cozy little cat cafe that goes 
-by the name of “The Wildcat Cafe”. The cafe housed multifarious species of cats, each with their 
-own unique personalities and quirks. They lived a peaceful life, being pampered by the cafe’s 
-patrons.|One day, a mysterious virus broke out at the cat cafe, taking down every cat one by one. 
-The virus was relentless and deadly, causing nausea, fever, seizures and eventually death. The cafe 
-owners were left with no choice and hence, had to close down the cafe and release the remaining cats 
-back into the forest.|Left stranded in the wild, the cats were anxious and traumatized by the 
-catastrophe. They had to navigate through the forest fighting off potential predators, while also 
-trying to unravel the mystery of the sudden virus outbreak. 
-    """,
-
-    """Upon a discussion amongst the cats, they have decided to choose 
-{number_of_playable_characters} cat(s) to protect them from predators while the rest help in 
-navigation and finding clues to the mystery... 
-    """
-]
-
-SCENE_ONE = [
-    """The chosen cat(s) stood strong, ready to fight off any predators to protect their 
-companions. As they ventured deeper into the forest and the sun starts to set, The cats felt a 
-sense of anticipation building within them, knowing that danger lurked in the shadows.|Without 
-warning, a pair of glowing eyes formed in the shadows, fixated upon the cats with an unsettling 
-intensity. With a sharp hiss, Viperstrike, a cunning serpent-like creature, slithered out from the 
-tangled vines. Its venomous fangs dripped with a toxic substance, ready to strike at the first 
-opportunity. The cats braced themselves, their fur standing on end, instinctively recognizing 
-the imminent danger.
-    """,
-
-"""As Viperstrike's menacing form lay defeated on the forest floor, the victorious cats shared a 
-collective sigh of relief. Their courage and teamwork had triumphed over the formidable enemy. 
+The prose lives in combatgame.resources._lore_text and is only imported
+on the first attribute access (PEP 562), so importing the scene modules
+doesn't load the large text blocks until the game actually narrates
+something.
 """
-]
+from importlib import import_module
 
-SCENE_TWO = """While the cats were about to venture deeper into the forest, Sage, a wise and 
-knowledgable cat, discovered something unusual about Viperstrike. It was a peculiar mark on the 
-serpent's scales — a symbol they had seen before.|It resembled a lowercase sigma symbol(σ), similar 
-to the emblem of the now-closed Wildcat Cafe. |This discovery left them puzzled, raising questions 
-about a potential connection between the cafe and the virus outbreak. Suspicion started to creep 
-into their minds. Was the cafe owner behind all these catastrophe?|The cats decided to not waste 
-any more time and continued venturing deeper into the forest finding for more clues...|
-Upon wandering into the forest, the cats were presented with three distinct paths that led deeper 
-into the forest. Each path held its own mysteries and potential clues to the virus outbreak and the 
-sigma symbol..."""
+# the loaded _lore_text module, populated on first attribute access
+_text = None
 
-SCENE_TWO_OPTION_ONE = [
-    """The cats decided to descend into the depths of the Whispering Caverns 
-in hopes of uncovering more hints.|However, after exploring the caverns for awhile, they were met 
-with a dead end with no further hints to the mystery. Feeling disappointed and exhausted, they 
-searched for a cozy spot in the caverns to rest till morning. Zzzz. (Characters stats restored)
-""",
-"""\"Wake up, wake up!\", Shadowpaw, the stealthy assassin cat, urgently whispered to his friends 
-at 4 in the morning. Startled, the other cats shook off their drowsiness and gathered around 
-Shadowpaw, their eyes gleaming with curiosity.|"I sense danger nearby," Shadowpaw hissed, 
-his senses on high alert. "There's something lurking in the shadows. We must proceed with caution."
-Upon hearing Shadowpaw's urgent words, a wave of worry washed over the cats, instantly heightening 
-their senses and sharpening their focus.|As they proceeded, growling sounds, growing louder and 
-louder, could be heard echoing through the caverns. Suddenly, a bone-chilling howl pierced the air, 
-causing them to freeze in their tracks. Emerging from the shadows was Doomshroud, a formidable and 
-cunning wolf, its eyes gleaming with a fierce intensity. |The atmosphere grew tense as the two 
-parties locked eyes, each recognizing the strength and determination in the other. It was clear 
-that a battle of wits and agility was about to unfold, as the cats prepared themselves for a deadly 
-encounter with the cunning Doomshroud.
-""",
 
-"""Emerging victorious from the intense battle with Doomshroud, the cats embraced the sight of the 
-rising sun. Determined not to waste another moment, they pressed forward towards their next 
-destination: The Misty Peaks.|The towering mountains beckoned with an air of mystery, enticing the 
-feline companions to embark on their next adventure. Curiosity ignited their spirits as they eagerly 
-anticipated the secrets that awaited them in the unexplored realm beyond.
-"""]
+def __getattr__(name):
+    """Load the lore text module on first access and forward lookups."""
+    global _text  # pylint: disable=global-statement
 
-SCENE_TWO_OPTION_TWO = ["""The Misty Peaks: To Be Continued..."""]
+    if _text is None:
+        _text = import_module("combatgame.resources._lore_text")
 
-SCENE_TWO_OPTION_THREE = [
-    """As the cats made their way along the Enchanted Meadow, they were greeted by a surreal and 
-ethereal landscape. Softly glowing flowers illuminated their path, casting a gentle radiance in 
-the moonlight.|Suddenly, the cats found themselves surrounded by a mesmerizing display of magical 
-fireflies. As the fireflies danced around them, they could feel their magic points replenishing, 
-empowering them for the challenges that lay ahead. (+10 magic points to all characters)|Despite 
-thorough exploration and diligent searching in the mystical surroundings, the cats found themselves 
-unable to uncover any tangible clues or hints. Undeterred by their lack of clues, the cats stood 
-strong and headed back to where they came from.|While making their way back through the forest, 
-a sudden change in the atmosphere signaled an approaching storm. A distant rumble echoed through 
-the trees, growing louder with each passing moment. The gentle rain turned into a torrential 
-downpour, accompanied by flashes of lightning that illuminated the surroundings with an eerie 
-glow.""",
+    try:
+        return getattr(_text, name)
 
-"""As the rain poured down outside, the cats sought refuge within the depths of the Whispering 
-Caverns. Little did they know, their decision to seek shelter in the Whispering Caverns would soon 
-be filled with regret.|As the cats cautiously navigated through the dark and eerie Whispering 
-Caverns, a pair of glowing eyes suddenly pierced through the shadows. Doomshroud, the fearsome 
-wolf, emerged, revealing its sharp fangs and menacing presence. The air grew heavy with tension 
-as the two parties locked eyes, readying themselves for a battle that would determine their fate 
-in this treacherous underground realm.""",
+    except AttributeError as error:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from error
 
-"""Having taken refuge in the caverns until dawn, the cats felt a renewed sense of purpose as the 
-first rays of sunlight pierced through the darkness. With their sights set on the enigmatic Misty 
-Peaks, a sense of anticipation and curiosity filled their hearts. What mysteries awaited them 
-beyond the towering mountains? The feline companions pondered this question, eager to uncover the 
-secrets that lay ahead."""
-]
 
-SECOND_COMBAT_WIN = """With swift and coordinated strikes, the cats unleashed their combined 
-strength upon Doomshroud. The fierce wolf fought back with ferocity, but the cats' determination 
-and skill proved to be unmatched. As the final blow landed, Doomshroud let out a haunting howl 
-before succumbing to defeat, its menacing presence vanquished.|The cats proceeded to investigate 
-the carcass of the wolf for any potential relation to the mystery, but to no avail. Doomshroud 
-was merely just a hungry, desperate wolf driven by the instinct to survive.
-"""
+def iter_paragraphs(name):
+    """Yield the paragraphs of a lore block one at a time.
 
+    Parameters
+    ----------
+    name : str
+        The name of a lore constant (e.g. "SCENE_TWO").
 
-PLAYER_LOST = """Despite their courage and determination, the cats succumbed to the relentless 
-attacks. Their once-playful paws grew weak, their valiant hearts beat their final beats, and their 
-spirits ascended to the starry sky above. The forest fell silent, as if mourning the loss of these 
-brave feline warriors.
-"""
+    Yields
+    ------
+    str : the next paragraph of the block.
+    """
+
+    yield from __getattr__(name)
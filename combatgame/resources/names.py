@@ -0,0 +1,12 @@
+"""Interned proper-noun constants shared by the lore and the scenes.
+
+Keeping these in one place means a single str object backs both the
+enemy constructor arguments and the narration, and renaming an enemy
+or a location only touches one line.
+"""
+from sys import intern
+
+VIPERSTRIKE = intern("Viperstrike")
+DOOMSHROUD = intern("Doomshroud")
+WHISPERING_CAVERNS = intern("Whispering Caverns")
+MISTY_PEAKS = intern("The Misty Peaks")
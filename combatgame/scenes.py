@@ -1,13 +1,83 @@
 """Module to store scenes"""
 import time
+from sys import intern
 from typing import List
-from functools import partial
 
-from combatgame.ui import Ui
+from combatgame.animations import Animation
+from combatgame.menus import Menu
 from combatgame.game_manager import GameManager
 from combatgame.characters import BaseCharacter, Tank, MirrorMage, Healer, Assassin
 from combatgame.enemies import EnemyCharacter
 from combatgame.resources import lore
+from combatgame.resources.names import (
+    VIPERSTRIKE as _VIPERSTRIKE, DOOMSHROUD as _DOOMSHROUD
+)
+
+
+# character names interned once, so every replay reuses the same string
+# objects and dict lookups on them are pointer compares; the enemy names
+# come from resources.names so the narration shares the same objects
+_TANK_NAME = intern("Whiskerwall")
+_MIRROR_MAGE_NAME = intern("Purrception")
+_HEALER_NAME = intern("Meowdicine")
+_ASSASSIN_NAME = intern("Shadowpaw")
+
+# menu labels double as dict keys in the character-pick flow
+_TANK_LABEL = intern("Whiskerwall (Tank)")
+_MIRROR_MAGE_LABEL = intern("Purrception (MirrorMage)")
+_HEALER_LABEL = intern("Meowdicine (Healer)")
+_ASSASSIN_LABEL = intern("Shadowpaw (Assassin)")
+
+# scene_two branches as plain data: each option is a tuple of steps
+# interpreted by Scenes._run_steps, so no closures or dicts are rebuilt
+# per call
+_SCENE_TWO_OPTION_ONE = (
+    ("lore", "SCENE_TWO_OPTION_ONE", 0),
+    ("restore",),
+    ("lore", "SCENE_TWO_OPTION_ONE", 1),
+    ("combat", _DOOMSHROUD),
+    ("lore", "SCENE_TWO_OPTION_ONE", 2),
+    ("goto", "option_two"),
+)
+
+_SCENE_TWO_OPTION_TWO = (
+    ("lore", "SCENE_TWO_OPTION_TWO", 0),
+)
+
+_SCENE_TWO_OPTION_THREE = (
+    ("lore", "SCENE_TWO_OPTION_THREE", 0),
+    ("add_points", "magic_points", 10),
+    ("thunderstorm",),
+    ("lore", "SCENE_TWO_OPTION_THREE", 1),
+    ("combat", _DOOMSHROUD),
+    ("lore", "SCENE_TWO_OPTION_THREE", 2),
+    ("goto", "option_two"),
+)
+
+# goto targets by name
+_SCENE_TWO_TARGETS = {
+    "option_two": _SCENE_TWO_OPTION_TWO,
+}
+
+# menu labels to step tables
+_SCENE_TWO_OPTIONS = {
+    "The Whispering Caverns": _SCENE_TWO_OPTION_ONE,
+    "The Misty Peaks": _SCENE_TWO_OPTION_TWO,
+    "The Enchanted Meadows": _SCENE_TWO_OPTION_THREE,
+}
+
+# ordinals for the character-pick prompt; at most 3 picks, so the
+# Ui.ordinal arithmetic never needs to run (index with i - 1)
+_ORDINALS = ("1st", "2nd", "3rd")
+
+# fixed choice table for the character-pick menu; a character is only
+# constructed once the player actually picks it
+_CHOICES = (
+    (_TANK_LABEL, _TANK_NAME, Tank),
+    (_MIRROR_MAGE_LABEL, _MIRROR_MAGE_NAME, MirrorMage),
+    (_HEALER_LABEL, _HEALER_NAME, Healer),
+    (_ASSASSIN_LABEL, _ASSASSIN_NAME, Assassin),
+)
 
 
 class Scenes:
@@ -21,39 +91,110 @@ class Scenes:
         Whether to display lore or skip it
     """
 
-    def __init__(self):
-        self.selected_characters: List[BaseCharacter] = []
+    # class-level annotation keeps the type visible to checkers without
+    # re-evaluating it on every instance assignment
+    selected_characters: List[BaseCharacter]
+
+    def __init__(self, interactive: bool = True):
+        self.selected_characters = []
+
+        # dramatic pauses only make sense with a human watching; test
+        # harnesses pass interactive=False to skip them
+        self._interactive = interactive
+
+        # lazily created GameManager reused for every combat in a
+        # playthrough (see _start_combat)
+        self._combat = None
+
+    def _pause(self, seconds: float):
+        """Sleep for dramatic effect, skipped in non-interactive runs.
+
+        Parameters
+        ----------
+        seconds : float
+            The number of seconds to pause for.
+        """
+
+        if self._interactive:
+            time.sleep(seconds)
 
     def reset(self):
         """Resets the class variables to default values."""
 
-        self.selected_characters: List[BaseCharacter] = []
+        # clear in place so the list keeps its allocated capacity
+        self.selected_characters.clear()
+        self._combat = None
+
+    def _start_combat(self, enemies: List[EnemyCharacter]) -> bool:
+        """Run a combat against the given enemies.
+
+        The underlying GameManager is created on the first combat and
+        reused (with its enemies swapped) for every later one.
+
+        Parameters
+        ----------
+        enemies : list of EnemyCharacter
+            The enemy characters for this combat.
+
+        Returns
+        -------
+        player_won : bool
+            True if the player won, False otherwise.
+        """
+
+        Animation.display_combat_start(self.selected_characters, enemies)
 
-    def restore_all_character_stats(self):
-        """restore stats for alive player characters"""
+        if self._combat is None:
+            self._combat = GameManager(self.selected_characters, enemies)
+        else:
+            self._combat.set_enemies(enemies)
 
-        for character in self.selected_characters:
-            if character.is_alive():
-                character.restore_stats()
+        return self._combat.start_combat()
 
-    def add_points_to_all_characters(self, stat: str, amount: int):
+    def _alive_characters(self) -> List[BaseCharacter]:
+        """Return the currently alive selected characters."""
+
+        return [
+            character for character in self.selected_characters
+            if character.is_alive()
+        ]
+
+    def restore_all_character_stats(self, alive: List[BaseCharacter] = None):
+        """restore stats for alive player characters
+
+        Parameters
+        ----------
+        alive : list of BaseCharacter
+            Pre-filtered alive characters; computed if not given.
+        """
+
+        if alive is None:
+            alive = self._alive_characters()
+
+        for character in alive:
+            character.restore_stats()
+
+    def add_points_to_all_characters(
+        self, stat: str, amount: int, alive: List[BaseCharacter] = None
+    ):
         """Add stats points to all alive player characters
-        
+
         Parameters
         ----------
         stat : str
             The attribute name of a stat.
         amount : int
             The amount to add.
+        alive : list of BaseCharacter
+            Pre-filtered alive characters; computed if not given.
         """
 
-        for character in self.selected_characters:
-            if character.is_alive():
-                # get the current value of that stat
-                current_value = getattr(character, stat, 0)
+        if alive is None:
+            alive = self._alive_characters()
 
-                # increase the value of that stat by `amount`
-                setattr(character, stat, current_value + amount)
+        for character in alive:
+            # increase the value of that stat by `amount`
+            setattr(character, stat, getattr(character, stat, 0) + amount)
 
     def start_scene(self):
         """Start of the game flow.
@@ -64,43 +205,43 @@ class Scenes:
             True if game is over, False otherwise.
         """
 
-        Ui.execute_lore(lore.START_GAME[0])
+        Animation.execute_lore(lore.START_GAME[0])
 
         # create Menu object to let player choose number of playable characters
-        choice_menu = Ui.Menu("Choose Number of Playable Characters", {1: 1, 2: 2, 3: 3})
+        choice_menu = Menu("Choose Number of Playable Characters", {1: 1, 2: 2, 3: 3})
         number_of_playable_characters = choice_menu.select_option()
 
-        Ui.execute_lore(
-            lore.START_GAME[1].format(
-                number_of_playable_characters=number_of_playable_characters
-                )
+        # the formatted block is precompiled per feasible count
+        Animation.execute_lore(
+            lore.START_GAME_1_BY_COUNT[number_of_playable_characters - 1]
             )
 
-        # options dictionary for menu
-        characters = {
-            "Whiskerwall (Tank)": ["Whiskerwall (Tank)", Tank("Whiskerwall")],
-            "Purrception (MirrorMage)": ["Purrception (MirrorMage)", MirrorMage("Purrception")],
-            "Meowdicine (Healer)": ["Meowdicine (Healer)", Healer("Meowdicine")],
-            "Shadowpaw (Assassin)": ["Shadowpaw (Assassin)", Assassin("Shadowpaw")]
-            }
+        # indices into _CHOICES the player can still pick from
+        remaining = set(range(len(_CHOICES)))
+
+        # one menu object reused for every pick; only its title and
+        # options change between iterations
+        choose_character_menu = Menu("", {})
 
         # let user select their characters
         for i in range(1, number_of_playable_characters + 1):
 
-            # menu for choosing characters
-            choose_character_menu = Ui.Menu(
-                f"Choose Your {Ui.ordinal(i)} Character",
-                characters
+            # update the menu for this pick; option values are indices
+            # into the fixed _CHOICES tuple
+            choose_character_menu.set_title(f"Choose Your {_ORDINALS[i - 1]} Character")
+            choose_character_menu.set_options(
+                {_CHOICES[index][0]: index for index in sorted(remaining)}
                 )
 
             # get the user to select an option
-            selected_character = choose_character_menu.select_option()
+            selected_index = choose_character_menu.select_option()
 
-            # stores the selected character in a list
-            self.selected_characters.append(selected_character[1])
+            # O(1) removal so the character can't be picked again
+            remaining.discard(selected_index)
 
-            # prevents player from choosing the same character again
-            characters.pop(selected_character[0])
+            # construct only the chosen character
+            _, name, character_class = _CHOICES[selected_index]
+            self.selected_characters.append(character_class(name))
 
         return False
 
@@ -114,127 +255,130 @@ class Scenes:
         """
 
         # Create the list of EnemyCharacter objects met in the first scene
-        encountered_enemies = [EnemyCharacter("Viperstrike")]
+        encountered_enemies = [EnemyCharacter(_VIPERSTRIKE)]
 
         # display lore
-        Ui.execute_lore(lore.SCENE_ONE[0])
+        Animation.execute_lore(lore.SCENE_ONE[0])
 
         # starts the combat
-        Ui.Animation.display_combat_start(self.selected_characters, encountered_enemies)
-        first_combat = GameManager(self.selected_characters, encountered_enemies)
-        player_won = first_combat.start_combat()
-        time.sleep(2)
+        player_won = self._start_combat(encountered_enemies)
+        self._pause(2)
 
         if not player_won:
-            Ui.execute_lore(lore.PLAYER_LOST)
+            Animation.stream_lore(lore.iter_paragraphs("PLAYER_LOST"))
             return True
 
-        Ui.execute_lore(lore.SCENE_ONE[1])
+        Animation.execute_lore(lore.SCENE_ONE[1])
         return False
 
-    def scene_two(self, flash=True):
-        """First scene of the game flow.
-        
+    def _second_combat(self, enemy_name: str):
+        """Run the second combat scene against the given enemy.
+
         Parameters
         ----------
-        flash : bool
-            Whether to have flash effects for thunderstorm. Defaults to True.
+        enemy_name : str
+            The name of the enemy to fight.
 
         Returns
         -------
         game_over : bool
-            True if game is over, False otherwise.
-
-        Notes
-        -----
-        FLASH WARNING!!
+            True if the player lost, False otherwise.
         """
 
-        Ui.execute_lore(lore.SCENE_TWO)
+        # enemy involved in second combat scene
+        player_won = self._start_combat([EnemyCharacter(enemy_name)])
 
-        def second_combat_scene():
+        if not player_won:
+            return True
 
-            # enemy involved in second combat scene
-            enemies = [EnemyCharacter("Doomshroud")]
+        Animation.stream_lore(lore.iter_paragraphs("SECOND_COMBAT_WIN"))
+        return False
 
-            Ui.Animation.display_combat_start(self.selected_characters, enemies)
+    def _run_steps(self, steps: tuple, flash: bool = True):
+        """Interpret a data-driven sequence of scene steps.
 
-            # Create GameManager object and start combat
-            second_combat = GameManager(self.selected_characters, enemies)
-            player_won = second_combat.start_combat()
+        Parameters
+        ----------
+        steps : tuple
+            The step table to run (see _SCENE_TWO_OPTION_*).
+        flash : bool
+            Whether to have flash effects for thunderstorm. Defaults to True.
 
-            if not player_won:
-                return True
+        Returns
+        -------
+        game_over : bool
+            True if game is over, False otherwise.
+        """
 
-            Ui.execute_lore(lore.SECOND_COMBAT_WIN)
-            return False
+        for step in steps:
+            opcode = step[0]
 
-        def option_one_scene():
-            # the scene if the player chose option 1
+            if opcode == "lore":
+                Animation.execute_lore(getattr(lore, step[1])[step[2]])
 
-            option_one_lore = lore.SCENE_TWO_OPTION_ONE
-            Ui.execute_lore(option_one_lore[0])
+            elif opcode == "restore":
+                self.restore_all_character_stats()
 
-            # restore all character stats
-            self.restore_all_character_stats()
+            elif opcode == "add_points":
+                self.add_points_to_all_characters(step[1], step[2])
 
-            Ui.execute_lore(option_one_lore[1])
+            elif opcode == "thunderstorm":
+                # purely visual pacing, skipped in non-interactive runs
+                if self._interactive:
+                    Animation.display_thunderstorm(flash=flash)
 
-            player_won = second_combat_scene()
+            elif opcode == "combat":
+                # end the scene immediately if the player lost
+                if self._second_combat(step[1]):
+                    return True
 
-            # return game_over = True, if player lost.
-            if not player_won:
-                return True
+            elif opcode == "goto":
+                return self._run_steps(_SCENE_TWO_TARGETS[step[1]], flash)
 
-            Ui.execute_lore(option_one_lore[2])
-            return option_two_scene()
+        return False
 
-        def option_two_scene():
-            # the scene if the player chose option 2
+    def scene_two(self, flash=True):
+        """First scene of the game flow.
 
-            Ui.execute_lore(lore.SCENE_TWO_OPTION_TWO[0])
+        Parameters
+        ----------
+        flash : bool
+            Whether to have flash effects for thunderstorm. Defaults to True.
 
-        def option_three_scene():
-            # the scene if the player chose option 3
+        Returns
+        -------
+        game_over : bool
+            True if game is over, False otherwise.
 
-            option_three_lore = lore.SCENE_TWO_OPTION_THREE
-            Ui.execute_lore(option_three_lore[0])
+        Notes
+        -----
+        FLASH WARNING!!
+        """
 
-            # add 10 magic points to alive player characters
-            self.add_points_to_all_characters("magic_points", 10)
+        Animation.stream_lore(lore.iter_paragraphs("SCENE_TWO"))
 
-            Ui.Animation.display_thunderstorm(flash=flash)
-            Ui.execute_lore(option_three_lore[1])
+        # the menu options are plain step tables
+        options_menu = Menu("Choose a Path", _SCENE_TWO_OPTIONS)
+        selected_steps = options_menu.select_option()
 
-            player_won = second_combat_scene()
-            if not player_won:
-                # return game_over = True, if player lost.
-                return True
+        # run the selected option's steps and return result
+        return self._run_steps(selected_steps, flash)
 
-            Ui.execute_lore(option_three_lore[2])
-            return option_two_scene()
+    def run_scenes(self, flash):
+        """Run the scenes in order."""
+        for scene in (self.start_scene, self.scene_one):
+            if scene():
+                self._game_over()
+                return
 
-        scene_two_options_dict = {
-            "The Whispering Caverns": option_one_scene,
-            "The Misty Peaks": option_two_scene,
-            "The Enchanted Meadows": option_three_scene
-        }
+        if self.scene_two(flash):
+            self._game_over()
 
-        options_menu = Ui.Menu("Choose a Path", scene_two_options_dict)
-        selected_option = options_menu.select_option()
+    def _game_over(self):
+        """Reset state and play the game over sequence."""
 
-        # run the selected option scene and return result
-        return selected_option()
+        # resets class variables
+        self.reset()
 
-    def run_scenes(self, flash):
-        """Run the scenes in order."""
-        scenes_order = [self.start_scene, self.scene_one, partial(self.scene_two, flash)]
-        for scene in scenes_order:
-            game_over = scene()
-            if game_over:
-                # resets class variables
-                self.reset()
-
-                Ui.Animation.display_game_over()
-                time.sleep(2)
-                return
+        Animation.display_game_over()
+        self._pause(2)
@@ -1,10 +1,17 @@
 """Classes implemenetation for skills"""
 
-import os
+import re
 import random
+from sys import intern
+from copy import copy
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
-from combatgame.utils.utils import csv_to_dict
+from combatgame import _kernels
+
+# typed rows generated from data/skill_attributes.csv by
+# scripts/gen_skill_attrs.py, so startup skips CSV parsing entirely
+from combatgame._skill_attrs_gen import SKILL_ATTRS as _SKILL_ATTRS
 
 # import only for type hinting
 if TYPE_CHECKING:
@@ -12,14 +19,107 @@ if TYPE_CHECKING:
     from combatgame.enemies import EnemyCharacter
 
 
-# get directory of this file
-this_file_dir = os.path.dirname(os.path.abspath(__file__))
+# random.random is a raw C call, unlike random.randint which re-checks
+# its bounds in Python on every draw; every skill roll here is a small
+# fixed range, so scale the float directly (same trick as the luck roll
+# in characters.basic_attack)
+_random = random.random
+
+
+def _roll(low: int, span: int) -> int:
+    """Return a uniform integer in [low, low + span - 1].
+
+    Parameters
+    ----------
+    low : int
+        The lowest value of the roll.
+    span : int
+        The number of possible values.
+    """
+
+    return low + int(_random() * span)
+
+
+# every skill has exactly three display messages, so picking one is a
+# _roll over a known length with no per-call len() or range checks
+_N_MSGS = 3
+
+# the display messages only ever substitute these two keys
+_PLACEHOLDER_RE = re.compile(r"\{(character|target)\}")
+
+
+def _compile_message(message: str) -> tuple:
+    """Split a display message around its placeholders once.
+
+    Parameters
+    ----------
+    message : str
+        The raw message with {character}/{target} placeholders.
+
+    Returns
+    -------
+    tuple : literal fragments alternating with placeholder keys.
+    """
+
+    return tuple(_PLACEHOLDER_RE.split(message))
+
+
+def _render_message(parts: tuple, character_name: str, target_name: str = "") -> str:
+    """Join a pre-split message with the given names filled in.
+
+    Parameters
+    ----------
+    parts : tuple
+        A compiled message from _compile_message.
+    character_name : str
+        The name substituted for {character}.
+    target_name : str
+        The name substituted for {target}.
+    """
+
+    out = [parts[0]]
+    append = out.append
+
+    # odd indices are placeholder keys, even indices literal text
+    for i in range(1, len(parts), 2):
+        append(character_name if parts[i] == "character" else target_name)
+        append(parts[i + 1])
 
-# skill_attributes.csv file path
-skill_attributes_path = f"{this_file_dir}/data/skill_attributes.csv"
+    return "".join(out)
+
+
+class SkillUnavailable(Exception):
+    """Raised when a character lacks the points to use a skill.
+
+    The exception message is the battle log line explaining which
+    points were missing.
+    """
+
+
+def _bind_skill(cls):
+    """Class decorator installing a skill's CSV row as class attributes.
+
+    The row is looked up once at class-definition time, so instances
+    carry no per-init attribute assignments at all.
+    """
 
-# convert skill_attributes.csv to python dictionary
-skill_attributes = csv_to_dict(skill_attributes_path, "skill")
+    attr = _SKILL_ATTRS[cls.__name__]
+
+    # the multi-word names aren't auto-interned like identifier-style
+    # literals; interning them here makes later dict lookups and
+    # comparisons on skill names pointer checks
+    cls.name = intern(attr["name"])
+    cls.magic_points_cost = attr["mp_cost"]
+    cls.speed_points_cost = attr["sp_cost"]
+    cls.require_target = attr["require_target"]
+    cls.belongs_to = intern(attr["belongs_to"])
+
+    # pre-split the display messages so use() never re-parses the
+    # {character}/{target} placeholders
+    cls.message_parts = tuple(
+        _compile_message(message) for message in cls.message_displays
+    )
+    return cls
 
 
 class BaseSkill:
@@ -42,8 +142,11 @@ class BaseSkill:
     require_target : bool
         True if skill affects an enemy, False otherwise.
 
-    message_displays : list of str
-        A list of message displays when skill is used.
+    message_displays : tuple of str
+        The message displays when skill is used.
+
+    message_parts : tuple
+        The pre-split message displays, filled in by _bind_skill.
 
     belongs_to : str
         The character the skill belongs to.
@@ -54,34 +157,29 @@ class BaseSkill:
     magic_points_cost: int = 0
     speed_points_cost: int = 0
     require_target: bool = False
-    message_displays: list[str] = []
+    message_displays: tuple = ()
+    message_parts: tuple = ()
     belongs_to: str = ""
 
-    def __init__(self, skill_class_name: str):
-        """Initialize a skill instance.
+    # all skill data lives on the classes, so instances need no
+    # __dict__ at all
+    __slots__ = ()
 
-        Parameters
-        ----------
-        skill_class_name : str
-            The name of the class of the skill.
+    def __new__(cls):
+        """Return the shared instance of the skill class.
+
+        Skills hold no per-character state (use() takes the character
+        as an argument), so each concrete class is a singleton. The
+        cls.__dict__ check keeps a subclass from inheriting another
+        class's instance.
         """
-        self._assign_skill_attributes(skill_class_name)
+        instance = cls.__dict__.get("_instance")
 
-    def _assign_skill_attributes(self, skill_class_name: str):
-        """Assign skill attributes from skill_attributes.csv.
+        if instance is None:
+            instance = super().__new__(cls)
+            cls._instance = instance
 
-        Parameters
-        ----------
-        skill_class_name : str
-            The name of the class of the skill.
-        """
-        attr = skill_attributes[skill_class_name]
-        self.name: str = str(attr["name"])
-        self.magic_points_cost: int = int(attr["mp_cost"])
-        self.speed_points_cost: int = int(attr["sp_cost"])
-        require_target_attr = str(attr["require_target"]).lower()
-        self.require_target: bool = require_target_attr == "yes"
-        self.belongs_to: str = str(attr["belongs_to"])
+        return instance
 
     def use(self, character: "BaseCharacter", target: "EnemyCharacter" = None):
         """Use the skill."""
@@ -95,9 +193,10 @@ class SkillEffects:
     It provides a centralized location to access and manage the different skills effects.
     """
 
+    @dataclass(slots=True)
     class Invincible:
         """Data class for invincible effect.
-        
+
         Attributes
         ----------
         name : str
@@ -109,22 +208,23 @@ class SkillEffects:
         belongs_to : BaseSkill
             The skill the effect belong to.
         """
-        def __init__(self):
-            self.name = "Invincible"
-            self.description = "Blocks any incoming attacks."
-            self.use_count = 1
-            self.belongs_to = "Illusionary Aura"
+
+        name: str = "Invincible"
+        description: str = "Blocks any incoming attacks."
+        use_count: int = 1
+        belongs_to: str = "Illusionary Aura"
 
         def __str__(self):
             return self.name
 
+    @dataclass(slots=True)
     class ReflectiveShield:
         """Data class for reflective shield effect."""
-        def __init__(self):
-            self.name = "Reflective Shield"
-            self.description = "Reflects any incoming attacks back to the enemies."
-            self.use_count = 1
-            self.belongs_to = "Reflective Shield"
+
+        name: str = "Reflective Shield"
+        description: str = "Reflects any incoming attacks back to the enemies."
+        use_count: int = 1
+        belongs_to: str = "Reflective Shield"
 
         def take_effect(self, attacker: "BaseCharacter", damage: int):
             """Use the effect.
@@ -142,14 +242,16 @@ class SkillEffects:
                 The battle log.
             """
 
-            # if damage more than attacker's defense points,
-            # deal remaining damage to attacker's health points
-            defense_points_damage = min(damage, attacker.defense_points)
-            health_points_damage = max(0, damage - attacker.defense_points)
-
-            # deals the damage
-            attacker.defense_points -= defense_points_damage
-            attacker.health_points -= health_points_damage
+            # the numeric core lives in _kernels so batch simulations
+            # can run it on bare ints
+            (
+                attacker.health_points,
+                attacker.defense_points,
+                defense_points_damage,
+                health_points_damage,
+            ) = _kernels.reflective_shield(
+                attacker.health_points, attacker.defense_points, damage
+            )
 
             log = f"{attacker.name}'s attack was met with a defensive shield, " \
                 "causing the damage to reflect back to themselves. " \
@@ -162,548 +264,551 @@ class SkillEffects:
             return self.name
 
 
-class Skills:
-    """A container class for storing skill classes.
+# prototype effect instances; activations copy these instead of running
+# __init__ again. A plain copy is needed (not sharing) because the
+# combat loop mutates use_count on the active effect.
+_INVINCIBLE_PROTO = SkillEffects.Invincible()
+_REFLECTIVE_PROTO = SkillEffects.ReflectiveShield()
+
 
-    This class serves as a container for all the skills in the game.
-    It provides a centralized location to access and manage the different skills.
+# Tank job class skill (WhiskerGuard, ClawSwipe)
+@_bind_skill
+class WhiskerGuard(BaseSkill):
+    """Represents WhiskerGuard skill.
+
+    Attributes
+    ----------
+    name : str
+        The name of the skill.
+
+    description : str
+        The description of the skill.
+
+    magic_points_cost : int
+        The amount of magic points cost to use this skill.
+
+    speed_points_cost : int
+        The amount of speed points cost to use this skill.
+
+    message_displays : tuple of str
+        The message displays when skill is used.
     """
 
-    # Tank job class skill (WhiskerGuard, ClawSwipe)
-    class WhiskerGuard(BaseSkill):
-        """Represents WhiskerGuard skill.
+    __slots__ = ()
 
-        Attributes
-        ----------
-        name : str
-            The name of the skill.
+    description = "Increases the character's defense by a random amount with " \
+        "cat-like reflexes."
+    message_displays = (
+        "With a swift movement, {character} activates Whisker Guard, shielding itself " \
+            "from harm.",
+        "{character} activates Whisker Guard, increasing their own defense.",
+        "By focusing their inner cat instincts, {character} empowers their defense with " \
+            "Whisker Guard, ready to withstand any attack."
+    )
 
-        description : str
-            The description of the skill.
+    def use(self, character: "BaseCharacter", target: "EnemyCharacter" = None):
+        """Use the WhiskerGuard skill.
+        Increases defense point by 5 to 15 points.
 
-        magic_points_cost : int
-            The amount of magic points cost to use this skill.
+        Parameters
+        ----------
+        character : BaseCharacter
+            The character thats using the skill.
 
-        speed_points_cost : int
-            The amount of speed points cost to use this skill.
+        Target : EnemyCharacter
+            The enemy to use the skill on.
 
-        message_displays : list of str
-            A list of message displays when skill is used.
+        Returns
+        -------
+        log : str
+            The log for using this skill.
         """
 
-        def __init__(self):
-            self.description = "Increases the character's defense by a random amount with " \
-                "cat-like reflexes."
-            self.message_displays = [
-                "With a swift movement, {character} activates Whisker Guard, shielding itself " \
-                    "from harm.",
-                "{character} activates Whisker Guard, increasing their own defense.",
-                "By focusing their inner cat instincts, {character} empowers their defense with " \
-                    "Whisker Guard, ready to withstand any attack."
-            ]
+        # amount of defense points to increase by
+        defense_points_increase = _roll(5, 11)
 
-            # initialize attributes of BaseSkill class
-            super().__init__(self.__class__.__name__)
+        # increase character's defense points
+        character.defense_points += defense_points_increase
 
-        def use(self, character: "BaseCharacter", target: "EnemyCharacter" = None):
-            """Use the WhiskerGuard skill.
-            Increases defense point by 5 to 15 points.
+        # choose a random display message
+        message_parts = self.message_parts[_roll(0, _N_MSGS)]
 
-            Parameters
-            ----------
-            character : BaseCharacter
-                The character thats using the skill.
+        # returns log
+        return _render_message(message_parts, character.name) + \
+            f"\n(+{defense_points_increase} Defense Points)"
 
-            Target : EnemyCharacter
-                The enemy to use the skill on.
+@_bind_skill
+class ClawSwipe(BaseSkill):
+    """Represents ClawSwipe skill.
 
-            Returns
-            -------
-            log : str
-                The log for using this skill.
-            """
+    Attributes
+    ----------
+    name : str
+        The name of the skill.
 
-            # amount of defense points to increase by
-            defense_points_increase = random.randint(5, 15)
+    description : str
+        The description of the skill.
 
-            # increase character's defense points
-            character.defense_points += defense_points_increase
+    magic_points_cost : int
+        The amount of magic points cost to use this skill.
 
-            # choose a random display message
-            message_display = random.choice(self.message_displays)
+    speed_points_cost : int
+        The amount of speed points cost to use this skill.
 
-            # returns log
-            return message_display.format(character=character.name) + \
-                f"\n(+{defense_points_increase} Defense Points)"
+    message_displays : tuple of str
+        The message displays when skill is used.
+    """
 
-    class ClawSwipe(BaseSkill):
-        """Represents ClawSwipe skill.
+    __slots__ = ()
 
-        Attributes
-        ----------
-        name : str
-            The name of the skill.
+    description = "Unleash a flurry of razor-sharp claws, striking enemies and " \
+        "removing their defense."
+    message_displays = (
+        "The sound of claws tearing through flesh fills the air as {character} " \
+            "delivers a devastating clawswipe, leaving {target} defenseless!",
+        "A flurry of razor-sharp claws slices through the air as {character} " \
+            "executes a powerful clawswipe, removing {target}'s defenses!",
+        "{target} is caught off guard as {character} launches a surprise attack " \
+            "with a ferocious clawswipe, rendering {target}'s defenses useless!"
+    )
 
-        description : str
-            The description of the skill.
+    def use(self, character: "BaseCharacter", target: "EnemyCharacter" = None):
+        """Use the ClawSwipe skill.
+        Removes target defense and deals remaining damage on target's health.
 
-        magic_points_cost : int
-            The amount of magic points cost to use this skill.
+        Parameters
+        ----------
+        character : BaseCharacter
+            The character thats using the skill.
 
-        speed_points_cost : int
-            The amount of speed points cost to use this skill.
+        Target : EnemyCharacter
+            The enemy to use the skill on.
 
-        message_displays : list of str
-            A list of message displays when skill is used.
+        Returns
+        -------
+        log : str
+            The log for using this skill.
         """
 
-        def __init__(self):
-            self.description = "Unleash a flurry of razor-sharp claws, striking enemies and " \
-                "removing their defense."
-            self.message_displays = [
-                "The sound of claws tearing through flesh fills the air as {character} " \
-                    "delivers a devastating clawswipe, leaving {target} defenseless!",
-                "A flurry of razor-sharp claws slices through the air as {character} " \
-                    "executes a powerful clawswipe, removing {target}'s defenses!",
-                "{target} is caught off guard as {character} launches a surprise attack " \
-                    "with a ferocious clawswipe, rendering {target}'s defenses useless!"
-            ]
-
-            # initialize attributes of BaseSkill class
-            super().__init__(self.__class__.__name__)
-
-        def use(self, character: "BaseCharacter", target: "EnemyCharacter" = None):
-            """Use the ClawSwipe skill.
-            Removes target defense and deals remaining damage on target's health.
+        # amount of damage to deal
+        damage_dealt = _roll(25, 11)
 
-            Parameters
-            ----------
-            character : BaseCharacter
-                The character thats using the skill.
+        # whatever the roll doesn't spend on defense hits health;
+        # the branchless core lives in _kernels
+        target.health_points, net_damage = _kernels.claw_swipe(
+            target.health_points, target.defense_points, damage_dealt
+        )
 
-            Target : EnemyCharacter
-                The enemy to use the skill on.
+        # remove target's defense regardless of damage dealt
+        target.defense_points = 0
 
-            Returns
-            -------
-            log : str
-                The log for using this skill.
-            """
+        # overall effect
+        battle_log = f"(removed {target.name} defense" + (
+            f" and dealt {net_damage}HP)" if net_damage else ")"
+        )
 
-            # overall effect
-            battle_log = f"(removed {target.name} defense)"
+        # choose a random display message
+        message_parts = self.message_parts[_roll(0, _N_MSGS)]
 
-            # amount of damage to deal
-            damage_dealt = random.randint(25, 35)
+        # return display message
+        return _render_message(message_parts, character.name, target.name) + \
+            "\n" + battle_log
 
-            # deal remaining damage to target's health if damage_dealt > target's defense points
-            if damage_dealt > target.defense_points:
 
-                # calculate net damage to target's health
-                net_damage = damage_dealt - target.defense_points
+# MirrorMage job class skill (IllusionaryAura, ReflectiveShield)
+@_bind_skill
+class IllusionaryAura(BaseSkill):
+    """Represents IllusionaryAura skill.
 
-                # decrease target's health by net_damage
-                target.health_points -= net_damage
+    Attributes
+    ----------
+    name : str
+        The name of the skill.
 
-                # update battle log
-                battle_log = f"(removed {target.name} defense and dealt {net_damage}HP)"
+    description : str
+        The description of the skill.
 
-            # remove target's defense regardless of damage dealt
-            target.defense_points = 0
+    magic_points_cost : int
+        The amount of magic points cost to use this skill.
 
-            # choose a random display message
-            message_display = random.choice(self.message_displays)
+    speed_points_cost : int
+        The amount of speed points cost to use this skill.
 
-            # return display message
-            return message_display.format(character=character.name, target=target.name) + \
-                "\n" + battle_log
+    message_displays : tuple of str
+        The message displays when skill is used.
+    """
 
+    __slots__ = ()
 
-    # MirrorMage job class skill (IllusionaryAura, ReflectiveShield)
-    class IllusionaryAura(BaseSkill):
-        """Represents IllusionaryAura skill.
+    description = "Creates a mesmerizing aura that confuses enemies, causing them " \
+        "to miss their attacks."
+    message_displays = (
+        "{character} casts Illusionary Aura, creating a captivating aura around " \
+            "themselves.",
+        "The mesmerizing aura of {character}'s Illusionary Aura confuses the enemy, " \
+            "causing them to miss their attack!",
+        "The enemy's attack goes astray as they are bewildered by the illusionary aura " \
+            "surrounding {character}."
+    )
 
-        Attributes
+    def use(self, character: "BaseCharacter", target: "EnemyCharacter" = None):
+        """Use the MirrorImage skill.
+        Creates a mesmerizing aura that confuses enemies, causing them to miss their attacks.
+
+        Parameters
         ----------
-        name : str
-            The name of the skill.
+        character : BaseCharacter
+            The character thats using the skill.
 
-        description : str
-            The description of the skill.
+        Target : EnemyCharacter
+            The enemy to use the skill on.
 
-        magic_points_cost : int
-            The amount of magic points cost to use this skill.
+        Returns
+        -------
+        log : str
+            The log for using this skill.
+        """
 
-        speed_points_cost : int
-            The amount of speed points cost to use this skill.
+        # set invincible skill effect to character
+        invincible = copy(_INVINCIBLE_PROTO)
+        character.active_effects[SkillEffects.Invincible] = invincible
+        character.effects_version += 1
 
-        message_displays : list of str
-            A list of message displays when skill is used.
-        """
+        # choose a random message display
+        message_parts = self.message_parts[_roll(0, _N_MSGS)]
 
-        def __init__(self):
-            self.description = "Creates a mesmerizing aura that confuses enemies, causing them " \
-                "to miss their attacks."
-            self.message_displays = [
-                "{character} casts Illusionary Aura, creating a captivating aura around " \
-                    "themselves.",
-                "The mesmerizing aura of {character}'s Illusionary Aura confuses the enemy, " \
-                    "causing them to miss their attack!",
-                "The enemy's attack goes astray as they are bewildered by the illusionary aura " \
-                    "surrounding {character}."
-            ]
-
-            # initialize attributes of BaseSkill class
-            super().__init__(self.__class__.__name__)
-
-        def use(self, character: "BaseCharacter", target: "EnemyCharacter" = None):
-            """Use the MirrorImage skill.
-            Creates a mesmerizing aura that confuses enemies, causing them to miss their attacks.
+        # return message display
+        return _render_message(message_parts, character.name) + \
+            f"\n({str(invincible)} Effect Activated)"
 
-            Parameters
-            ----------
-            character : BaseCharacter
-                The character thats using the skill.
+@_bind_skill
+class ReflectiveShield(BaseSkill):
+    """Represents ReflectiveShield skill.
 
-            Target : EnemyCharacter
-                The enemy to use the skill on.
+    Attributes
+    ----------
+    name : str
+        The name of the skill.
 
-            Returns
-            -------
-            log : str
-                The log for using this skill.
-            """
+    description : str
+        The description of the skill.
 
-            # set invincible skill effect to character
-            invincible = SkillEffects.Invincible()
-            character.active_effects.append(invincible)
+    magic_points_cost : int
+        The amount of magic points cost to use this skill.
 
-            # choose a random message display
-            message_display = random.choice(self.message_displays)
+    speed_points_cost : int
+        The amount of speed points cost to use this skill.
 
-            # return message display
-            return message_display.format(character=character.name) + \
-                f"\n({str(invincible)} Effect Activated)"
+    message_displays : tuple of str
+        The message displays when skill is used.
+    """
 
-    class ReflectiveShield(BaseSkill):
-        """Represents ReflectiveShield skill.
+    __slots__ = ()
 
-        Attributes
-        ----------
-        name : str
-            The name of the skill.
+    description = "Creates a magical barrier that reflects a portion of the next " \
+        "incoming spell back at the enemy."
+    message_displays = (
+        "A shimmering shield envelops {character}, ready to reflect incoming physical " \
+            "damage from {target}.",
+        "{character} channels their magic, creating a barrier of reflection to counter " \
+            "{target}'s assault.",
+        "{character}'s Reflective Shield sparkles with energy, poised to send " \
+            "{target}'s strength back at them."
+    )
 
-        description : str
-            The description of the skill.
+    def use(self, character: "BaseCharacter", target: "EnemyCharacter"=None):
+        """Use the ReflectiveShield skill.
+        Creates a magical barrier that reflects the next incoming attack back at the enemy.
 
-        magic_points_cost : int
-            The amount of magic points cost to use this skill.
+        Parameters
+        ----------
+        character : BaseCharacter
+            The character thats using the skill.
 
-        speed_points_cost : int
-            The amount of speed points cost to use this skill.
+        Target : EnemyCharacter
+            The enemy to use the skill on.
 
-        message_displays : list of str
-            A list of message displays when skill is used.
+        Returns
+        -------
+        log : str
+            The log for using this skill.
         """
 
-        def __init__(self):
-            self.description = "Creates a magical barrier that reflects a portion of the next " \
-                "incoming spell back at the enemy."
-            self.message_displays = [
-                "A shimmering shield envelops {character}, ready to reflect incoming physical " \
-                    "damage from {target}.",
-                "{character} channels their magic, creating a barrier of reflection to counter " \
-                    "{target}'s assault.",
-                "{character}'s Reflective Shield sparkles with energy, poised to send " \
-                    "{target}'s strength back at them."
-            ]
-
-            # initialize attributes of BaseSkill class
-            super().__init__(self.__class__.__name__)
-
-        def use(self, character: "BaseCharacter", target: "EnemyCharacter"=None):
-            """Use the ReflectiveShield skill.
-            Creates a magical barrier that reflects the next incoming attack back at the enemy.
+        # set reflective skill effect to active effects
+        reflective_shield = copy(_REFLECTIVE_PROTO)
+        character.active_effects[SkillEffects.ReflectiveShield] = reflective_shield
+        character.effects_version += 1
 
-            Parameters
-            ----------
-            character : BaseCharacter
-                The character thats using the skill.
+        # choose a random message display
+        message_parts = self.message_parts[_roll(0, _N_MSGS)]
 
-            Target : EnemyCharacter
-                The enemy to use the skill on.
+        # return message display
+        return _render_message(message_parts, character.name, target.name) + \
+            "\n(reflective shield effect activated)"
 
-            Returns
-            -------
-            log : str
-                The log for using this skill.
-            """
 
-            # set reflective skill effect to active effects
-            reflective_shield = SkillEffects.ReflectiveShield()
-            character.active_effects.append(reflective_shield)
+# Healer job class skill (HealingPurr, LuckyAura)
+@_bind_skill
+class HealingPurr(BaseSkill):
+    """Represents HealingPurr skill.
 
-            # choose a random message display
-            message_display = random.choice(self.message_displays)
+    Attributes
+    ----------
+    name : str
+        The name of the skill.
 
-            # return message display
-            return message_display.format(character=character.name, target=target.name) + \
-                "\n(reflective shield effect activated)"
+    description : str
+        The description of the skill.
 
+    magic_points_cost : int
+        The amount of magic points cost to use this skill.
 
-    # Healer job class skill (HealingPurr, LuckyAura)
-    class HealingPurr(BaseSkill):
-        """Represents HealingPurr skill.
+    speed_points_cost : int
+        The amount of speed points cost to use this skill.
 
-        Attributes
-        ----------
-        name : str
-            The name of the skill.
+    message_displays : tuple of str
+        The message displays when skill is used.
+    """
 
-        description : str
-            The description of the skill.
+    __slots__ = ()
+
+    description = "Restores health points and brings comfort through the power of " \
+        "purrs."
+    message_displays = (
+        "{character} emits a gentle purr, enveloping themselves in healing energy.",
+        "The soothing purrs of {character} resonate, restoring their health points.",
+        "{character}'s healing purr fills the air, bringing comfort and replenishing " \
+        "their vitality."
+    )
 
-        magic_points_cost : int
-            The amount of magic points cost to use this skill.
+    def use(self, character: "BaseCharacter", target: "EnemyCharacter" = None):
+        """Use the HealingPurr skill.
+        Increases its health points by 5 to 15 points.
+
+        Parameters
+        ----------
+        character : BaseCharacter
+            The character thats using the skill.
 
-        speed_points_cost : int
-            The amount of speed points cost to use this skill.
+        Target : EnemyCharacter
+            The enemy to use the skill on.
 
-        message_displays : list of str
-            A list of message displays when skill is used.
+        Returns
+        -------
+        log : str
+            The log for using this skill.
         """
 
-        def __init__(self):
-            self.description = "Restores health points and brings comfort through the power of " \
-                "purrs."
-            self.message_displays = [
-                "{character} emits a gentle purr, enveloping themselves in healing energy.",
-                "The soothing purrs of {character} resonate, restoring their health points.",
-                "{character}'s healing purr fills the air, bringing comfort and replenishing " \
-                "their vitality."
-            ]
+        # increase character's health points by 5 to 15 points
+        health_points_increase = _roll(5, 11)
+        character.health_points += health_points_increase
 
-            # initialize attributes of BaseSkill class
-            super().__init__(self.__class__.__name__)
+        # choose a random message display
+        message_parts = self.message_parts[_roll(0, _N_MSGS)]
 
-        def use(self, character: "BaseCharacter", target: "EnemyCharacter" = None):
-            """Use the HealingPurr skill.
-            Increases its health points by 5 to 15 points.
+        # return message display
+        return _render_message(message_parts, character.name) + \
+            f"\n(+{health_points_increase} health points)"
 
-            Parameters
-            ----------
-            character : BaseCharacter
-                The character thats using the skill.
+@_bind_skill
+class LuckyCharm(BaseSkill):
+    """Represents LuckyCharm skill.
 
-            Target : EnemyCharacter
-                The enemy to use the skill on.
+    Attributes
+    ----------
+    name : str
+        The name of the skill.
 
-            Returns
-            -------
-            log : str
-                The log for using this skill.
-            """
+    description : str
+        The description of the skill.
 
-            # increase character's health points by 5 to 15 points
-            health_points_increase = random.randint(5, 15)
-            character.health_points += health_points_increase
+    magic_points_cost : int
+        The amount of magic points cost to use this skill.
 
-            # choose a random message display
-            message_display = random.choice(self.message_displays)
+    speed_points_cost : int
+        The amount of speed points cost to use this skill.
 
-            # return message display
-            return message_display.format(character=character.name) + \
-                f"\n(+{health_points_increase} health points)"
+    message_displays : tuple of str
+        The message displays when skill is used.
+    """
 
-    class LuckyCharm(BaseSkill):
-        """Represents LuckyCharm skill.
+    __slots__ = ()
 
-        Attributes
-        ----------
-        name : str
-            The name of the skill.
+    description = "Channel inner luck to create a protective charm, increasing its " \
+        "luck and favoring positive outcomes."
+    message_displays = (
+        "The air around {character} shimmers with luck as the lucky charm takes effect.",
+        "The lucky charm envelops {character}, infusing them with a heightened sense of " \
+            "favorable outcomes.",
+        "With the lucky charm activated, {character} feels a surge of good luck " \
+            "coursing through their veins."
+    )
 
-        description : str
-            The description of the skill.
+    def use(self, character: "BaseCharacter", target: "EnemyCharacter" = None):
+        """Use the LuckyCharm skill.
+        Increases luck by 5%
 
-        magic_points_cost : int
-            The amount of magic points cost to use this skill.
+        Parameters
+        ----------
+        character : BaseCharacter
+            The character thats using the skill.
 
-        speed_points_cost : int
-            The amount of speed points cost to use this skill.
+        Target : EnemyCharacter
+            The enemy to use the skill on.
 
-        message_displays : list of str
-            A list of message displays when skill is used.
+        Returns
+        -------
+        log : str
+            The log for using this skill.
         """
 
-        def __init__(self):
-            self.description = "Channel inner luck to create a protective charm, increasing its " \
-                "luck and favoring positive outcomes."
-            self.message_displays = [
-                "The air around {character} shimmers with luck as the lucky charm takes effect.",
-                "The lucky charm envelops {character}, infusing them with a heightened sense of " \
-                    "favorable outcomes.",
-                "With the lucky charm activated, {character} feels a surge of good luck " \
-                    "coursing through their veins."
-            ]
+        luck_increase = 5
+        character.luck += luck_increase
 
-            # initialize attributes of BaseSkill class
-            super().__init__(self.__class__.__name__)
+        # choose a random display message
+        message_parts = self.message_parts[_roll(0, _N_MSGS)]
 
-        def use(self, character: "BaseCharacter", target: "EnemyCharacter" = None):
-            """Use the LuckyCharm skill.
-            Increases luck by 5%
+        # return display message
+        return _render_message(message_parts, character.name) + f"\n(+{luck_increase}% luck)"
 
-            Parameters
-            ----------
-            character : BaseCharacter
-                The character thats using the skill.
 
-            Target : EnemyCharacter
-                The enemy to use the skill on.
+# Assassin job class skill (PurrfectStrike, CripplingStrike)
+@_bind_skill
+class PurrfectStrike(BaseSkill):
+    """Represents PurrfectStrike skill.
 
-            Returns
-            -------
-            log : str
-                The log for using this skill.
-            """
+    Attributes
+    ----------
+    name : str
+        The name of the skill.
 
-            luck_increase = 5
-            character.luck += luck_increase
+    description : str
+        The description of the skill.
 
-            # choose a random display message
-            message_display = random.choice(self.message_displays)
+    magic_points_cost : int
+        The amount of magic points cost to use this skill.
 
-            # return display message
-            return message_display.format(character=character.name) + f"\n(+{luck_increase}% luck)"
+    speed_points_cost : int
+        The amount of speed points cost to use this skill.
 
+    message_displays : tuple of str
+        The message displays when skill is used.
+    """
 
-    # Assassin job class skill (PurrfectStrike, CripplingStrike)
-    class PurrfectStrike(BaseSkill):
-        """Represents PurrfectStrike skill.
+    __slots__ = ()
 
-        Attributes
-        ----------
-        name : str
-            The name of the skill.
+    description = " Unleash a swift and precise strike, targeting the enemy's weak " \
+        "spot with deadly accuracy, dealing high damage."
+    message_displays = (
+        "With lightning speed, {character} lunges at {target}, aiming for a critical hit.",
+        "The sound of a fierce, focused purr fills the air as {character} delivers a " \
+            "devastating blow at {target}.",
+        "{target} reels from {character}'s Purrfect Strike, unable to withstand the " \
+            "precise attack."
+    )
 
-        description : str
-            The description of the skill.
+    def use(self, character: "BaseCharacter", target: "EnemyCharacter" = None):
+        """Use the PurrfectStrike skill.
+        Removes target's defense and deals additional 15 to 25 damage to target's health
 
-        magic_points_cost : int
-            The amount of magic points cost to use this skill.
+        Parameters
+        ----------
+        character : BaseCharacter
+            The character thats using the skill.
 
-        speed_points_cost : int
-            The amount of speed points cost to use this skill.
+        Target : EnemyCharacter
+            The enemy to use the skill on.
 
-        message_displays : list of str
-            A list of message displays when skill is used.
+        Returns
+        -------
+        log : str
+            The log for using this skill.
         """
 
-        def __init__(self):
-            self.description = " Unleash a swift and precise strike, targeting the enemy's weak " \
-                "spot with deadly accuracy, dealing high damage."
-            self.message_displays = [
-                "With lightning speed, {character} lunges at {target}, aiming for a critical hit.",
-                "The sound of a fierce, focused purr fills the air as {character} delivers a " \
-                    "devastating blow at {target}.",
-                "{target} reels from {character}'s Purrfect Strike, unable to withstand the " \
-                    "precise attack."
-            ]
+        # removes target's defense
+        target.defense_points = 0
 
-            # initialize attributes of BaseSkill class
-            super().__init__(self.__class__.__name__)
+        # deal damage to target's health points
+        damage_dealt = _roll(15, 11)
+        target.health_points -= damage_dealt
 
-        def use(self, character: "BaseCharacter", target: "EnemyCharacter" = None):
-            """Use the PurrfectStrike skill.
-            Removes target's defense and deals additional 15 to 25 damage to target's health
+        # choose a random display message
+        message_parts = self.message_parts[_roll(0, _N_MSGS)]
 
-            Parameters
-            ----------
-            character : BaseCharacter
-                The character thats using the skill.
+        # returns message display
+        return _render_message(message_parts, character.name, target.name) + \
+            f"\n(removed {target.name}'s defense and dealt {damage_dealt}HP)"
 
-            Target : EnemyCharacter
-                The enemy to use the skill on.
+@_bind_skill
+class CripplingStrike(BaseSkill):
+    """Represents CripplingStrike skill.
 
-            Returns
-            -------
-            log : str
-                The log for using this skill.
-            """
+    Attributes
+    ----------
+    name : str
+        The name of the skill.
 
-            # removes target's defense
-            target.defense_points = 0
+    description : str
+        The description of the skill.
 
-            # deal damage to target's health points
-            damage_dealt = random.randint(15, 25)
-            target.health_points -= damage_dealt
+    magic_points_cost : int
+        The amount of magic points cost to use this skill.
 
-            # choose a random display message
-            message_display = random.choice(self.message_displays)
+    speed_points_cost : int
+        The amount of speed points cost to use this skill.
 
-            # returns message display
-            return message_display.format(character=character.name, target=target.name) + \
-                f"\n(removed {target.name}'s defense and dealt {damage_dealt}HP)"
+    message_displays : tuple of str
+        The message displays when skill is used.
+    """
 
-    class CripplingStrike(BaseSkill):
-        """Represents CripplingStrike skill.
+    __slots__ = ()
 
-        Attributes
-        ----------
-        name : str
-            The name of the skill.
+    description = "Deliver a precise strike that cripples the target, slowing " \
+        "their movements."
+    message_displays = (
+        "{target}'s agility is hindered by {character}'s crippling strike!",
+        "With a calculated strike, {character} impairs {target}'s mobility!",
+        "{character}'s crippling strike disrupts {target}'s flow, hampering their movement!"
+    )
 
-        description : str
-            The description of the skill.
+    def use(self, character: "BaseCharacter", target: "EnemyCharacter" = None):
+        """Use the CripplingStrike skill.
+        Reduce target's speed points by 5 to 15 points
 
-        magic_points_cost : int
-            The amount of magic points cost to use this skill.
+        Parameters
+        ----------
+        character : BaseCharacter
+            The character thats using the skill.
 
-        speed_points_cost : int
-            The amount of speed points cost to use this skill.
+        Target : EnemyCharacter
+            The enemy to use the skill on.
 
-        message_displays : list of str
-            A list of message displays when skill is used.
+        Returns
+        -------
+        log : str
+            The log for using this skill.
         """
 
-        def __init__(self):
-            self.description = "Deliver a precise strike that cripples the target, slowing " \
-                "their movements."
-            self.message_displays = [
-                "{target}'s agility is hindered by {character}'s crippling strike!",
-                "With a calculated strike, {character} impairs {target}'s mobility!",
-                "{character}'s crippling strike disrupts {target}'s flow, hampering their movement!"
-            ]
-
-            # initialize attributes of BaseSkill class
-            super().__init__(self.__class__.__name__)
-
-        def use(self, character: "BaseCharacter", target: "EnemyCharacter" = None):
-            """Use the CripplingStrike skill.
-            Reduce target's speed points by 5 to 15 points
-
-            Parameters
-            ----------
-            character : BaseCharacter
-                The character thats using the skill.
-
-            Target : EnemyCharacter
-                The enemy to use the skill on.
-
-            Returns
-            -------
-            log : str
-                The log for using this skill.
-            """
-
-            # reduce target's speed points
-            speed_reduction = random.randint(5, 15)
-            target.speed_points = max(0, target.speed_points - speed_reduction)
-
-            # choose a random message display
-            message_display = random.choice(self.message_displays)
-
-            # return message display
-            return message_display.format(character=character.name, target=target.name) + \
-                f"\n(Reduced {target.name} speed points by {speed_reduction})"
+        # reduce target's speed points
+        speed_reduction = _roll(5, 11)
+        target.speed_points = _kernels.crippling_strike(
+            target.speed_points, speed_reduction
+        )
+
+        # choose a random message display
+        message_parts = self.message_parts[_roll(0, _N_MSGS)]
+
+        # return message display
+        return _render_message(message_parts, character.name, target.name) + \
+            f"\n(Reduced {target.name} speed points by {speed_reduction})"
+
+
+# explicit name -> class registry, so dynamic lookups are a single dict
+# access instead of getattr on a namespace class
+SKILL_REGISTRY = {
+    cls.__name__: cls
+    for cls in (
+        WhiskerGuard, ClawSwipe, IllusionaryAura, ReflectiveShield,
+        HealingPurr, LuckyCharm, PurrfectStrike, CripplingStrike,
+    )
+}
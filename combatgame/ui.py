@@ -8,24 +8,77 @@ This module contains UI elements and utilities for the game.
 
 import os
 import sys
-import msvcrt
-import time
-import random
-import threading
-import textwrap
-from typing import AnyStr, Dict, TYPE_CHECKING, Callable, List
+import functools
+from itertools import zip_longest
+from typing import Dict, TYPE_CHECKING, List
 
 if TYPE_CHECKING:
     from combatgame.characters import BaseCharacter
     from combatgame.enemies import EnemyCharacter
 
 
+@functools.lru_cache(maxsize=64)
+def _bar_template(bar_length: int, filled_char: str, empty_char: str, filled_length: int):
+    """Return the bar portion of a percentage bar, cached by shape.
+
+    Stats hover around the same values for many frames in a row, so
+    most calls are cache hits that skip the string building entirely.
+    """
+
+    return filled_char * filled_length + empty_char * (bar_length - filled_length)
+
+
+# enable VT escape processing on legacy Windows consoles once at
+# import; os.system("") is the documented trick and costs one fork at
+# startup instead of one per clear
+if os.name == "nt":
+    os.system("")
+
+# clear screen and home the cursor
+_CLEAR_SCREEN = "\x1b[2J\x1b[H"
+
+
+@functools.lru_cache(maxsize=32)
+def _hborder(width: int, char: str = "═"):
+    """Return a horizontal border string, cached by width.
+
+    Menu and box widths are stable across a session, so the string
+    multiplication runs once per distinct width.
+    """
+
+    return char * width
+
+
+# ordinal suffixes indexed by last digit (clamped to 4)
+_ORD_SUFFIX = ('th', 'st', 'nd', 'rd', 'th')
+
+
+@functools.lru_cache(maxsize=256)
+def _ordinal(number: int):
+    """Return the ordinal string of an integer, cached per number.
+
+    Lives at module level so the cache holds plain ints rather than
+    bound-method references.
+    """
+
+    # special for 11th, 12th and 13th as it ends with th.
+    if 11 <= (number % 100) <= 13:
+        return str(number) + 'th'
+
+    # select the appropriate suffix based on the last digit of the number
+    return str(number) + _ORD_SUFFIX[min(number % 10, 4)]
+
+
 class Ui:
     """
     User Interface class to handle user input, displays game prompts and messages,
     and interacts with the game manager.
     """
 
+    # padded ASCII art layouts keyed by (art tuples, sep); see
+    # _render_ascii_art
+    _ascii_pad_cache: Dict = {}
+
     @staticmethod
     def create_percentage_bar(
         current_stat: int,
@@ -52,21 +105,41 @@ class Ui:
         # calculate the length of the bar to be filled
         filled_length = int(bar_length * current_stat / max_stat)
 
-        # return the percentage bar string
-        percentage_bar = f"{filled_char * filled_length:{empty_char}<{bar_length}s}"
-        return f"{percentage_bar} {current_stat}/{max_stat}"
+        # the bar itself is cached; the dynamic format-spec this used to
+        # build was re-parsed by the format mini-language on every call
+        bar_body = _bar_template(bar_length, filled_char, empty_char, filled_length)
+        return f"{bar_body} {current_stat}/{max_stat}"
+
+    @staticmethod
+    def invalidate_frame():
+        """Drop the cached combat frame so the next draw is a full redraw.
+
+        Called whenever something other than display_combat_screen
+        writes to the terminal (clears, skipped animations), since the
+        differential renderer assumes the screen still shows its last
+        frame.
+        """
+
+        Ui._last_frame = None
 
     @staticmethod
     def clear_terminal():
         """Clear the terminal screen"""
 
-        # for others
-        if os.name == "posix":
-            os.system("clear")
+        # the combat frame buffer no longer matches the screen, so the
+        # next combat frame must be a full redraw
+        Ui.invalidate_frame()
+
+        # a direct ANSI write avoids forking a shell for cls/clear on
+        # every animation frame
+        try:
+            sys.stdout.write(_CLEAR_SCREEN)
+            sys.stdout.flush()
 
-        # for windows
-        elif os.name == "nt":
-            os.system("cls")
+        except OSError:
+            # fall back to the shell command on terminals without
+            # VT escape support
+            os.system("cls" if os.name == "nt" else "clear")
 
     @staticmethod
     def ordinal(number: int):
@@ -82,55 +155,49 @@ class Ui:
         str : ordinal string of the integer.
         """
 
-        # special for 11th, 12th and 13th as it ends with th.
-        if 11 <= (number % 100) <= 13:
-            suffix = 'th'
-
-        # select the appropriate suffix based on the last digit of the number
-        else:
-            suffix = ['th', 'st', 'nd', 'rd', 'th'][min(number % 10, 4)]
-        return str(number) + suffix
+        # the memoized module-level helper does the work; turn numbers
+        # repeat within a session, so most calls are cache hits
+        return _ordinal(number)
 
     @staticmethod
-    def execute_lore(lore: str = None):
-        """prints the lore given. 
-        Use "|" to split sentences into paragraphs.
-
-        Parameters
-        ----------
-        lore : str
-        the lore to be displayed. Defaults to None.
-        """
-        # clear terminal
-        Ui.clear_terminal()
-
-        # splits lore into paragraphs
-        paragraphs = lore.split("|")
-
-        # loops through paragraphs to print to console
-        for paragraph in paragraphs:
-            paragraph = paragraph.rstrip()
-            Ui.Animation.print_with_animation(paragraph)
-            input("\n\n\nPress enter to continue...")
-            Ui.clear_terminal()
+    def _render_ascii_art(*characters, sep: str = "|"):
+        """Build side-by-side ASCII art lines without printing them.
 
-    @staticmethod
-    def display_ascii_art(*characters, sep: str = "|") -> list:
-        """Prints ASCII art side by side and sets the starting_column_position for the characters.
+        Also sets the starting_column_position for the characters.
 
         Parameters
         ----------
-        *arts : List[str]
-            List of ASCII arts to print out.
+        *characters : BaseCharacter
+            The characters whose ASCII arts to lay out.
         sep : str, optional
             The seperator used to separate the arts horizontally. Defaults to "|".
 
         Returns
         -------
-        sep_column_position: int
-            Starting column position for seperator.
+        rendered_lines : list of str
+            The combined art lines, top to bottom.
+        seperator_column_positions : list of int
+            Starting column position for each seperator.
         """
 
+        # the arts are immutable shared tuples, so keying on their
+        # contents computes the padded layout once per distinct line-up
+        # and can never go stale when characters are rebuilt between
+        # playthroughs (unlike ids, which CPython reuses after a free)
+        cache_key = (
+            tuple(character.ascii_art for character in characters), sep
+            )
+        cached = Ui._ascii_pad_cache.get(cache_key)
+
+        if cached is not None:
+            rendered_lines, seperator_column_positions, column_positions = cached
+
+            # restore starting column position
+            for index, character in enumerate(characters):
+                character.starting_column_position = column_positions[index]
+
+            return rendered_lines, seperator_column_positions
+
         # store all the character's ASCII Art in a list
         arts = [character.ascii_art for character in characters]
 
@@ -144,7 +211,7 @@ class Ui:
             height_difference = tallest_art_height - len(art)
 
             # append and prepend extra lines to align to bottom
-            art = [" "] * height_difference + art + [" "]
+            art = [" "] * height_difference + list(art) + [" "]
 
             # Get the width of the longest line
             longest_width = max(map(len, art), default=0)
@@ -159,31 +226,58 @@ class Ui:
         starting_column_positions = [0]
         seperator_column_positions = []
 
-        # print every line
-        for lines in zip(*arts):
-            print(sep.join(lines))
-
-            # runs the following code only once
-            if len(starting_column_positions) == 1:
+        # every line of an art has the same width after the ljust pass,
+        # so the column positions follow from the widths alone
+        for art in arts:
+            art_width = len(art[0])
 
-                # iterate through every art line
-                for line in lines:
-                    # calculate the seperator starting column position
-                    seperator_starting_column = starting_column_positions[-1] + len(line)
-
-                    # appends the calculated position to the seperator_column_position list
-                    seperator_column_positions.append(seperator_starting_column)
-
-                    # calculate the starting column position of the art
-                    line_starting_column = starting_column_positions[-1] + len(line) + len(sep)
+            # calculate the seperator starting column position
+            seperator_column_positions.append(
+                starting_column_positions[-1] + art_width
+                )
 
-                    # appends the calculated position to the starting_column_positions list
-                    starting_column_positions.append(line_starting_column)
+            # calculate the starting column position of the next art
+            starting_column_positions.append(
+                starting_column_positions[-1] + art_width + len(sep)
+                )
 
         # store starting column position
         for index, character in enumerate(characters):
             character.starting_column_position = starting_column_positions[index]
 
+        # combine the arts line by line
+        rendered_lines = [sep.join(lines) for lines in zip(*arts)]
+
+        # cache the layout for every later frame with this line-up
+        Ui._ascii_pad_cache[cache_key] = (
+            rendered_lines, seperator_column_positions, starting_column_positions
+            )
+
+        return rendered_lines, seperator_column_positions
+
+    @staticmethod
+    def display_ascii_art(*characters, sep: str = "|") -> list:
+        """Prints ASCII art side by side and sets the starting_column_position for the characters.
+
+        Parameters
+        ----------
+        *characters : BaseCharacter
+            The characters whose ASCII arts to print out.
+        sep : str, optional
+            The seperator used to separate the arts horizontally. Defaults to "|".
+
+        Returns
+        -------
+        sep_column_position: int
+            Starting column position for seperator.
+        """
+
+        rendered_lines, seperator_column_positions = Ui._render_ascii_art(
+            *characters, sep=sep
+            )
+
+        print("\n".join(rendered_lines))
+
         return seperator_column_positions
 
     @staticmethod
@@ -222,15 +316,17 @@ class Ui:
             for line in lines
         ]
 
+        border = _hborder(max_width + 2)
+
         # print the top line
-        print(f'╔{"═" * (max_width + 2)}╗')
+        print(f'╔{border}╗')
         # print content line
         print(*box, sep='\n')
         # print the bottom line
-        print(f'╚{"═" * (max_width + 2)}╝')
+        print(f'╚{border}╝')
 
     @staticmethod
-    def display_combat_stats(
+    def _render_combat_stats(
         character_one: "BaseCharacter",
         character_two: "BaseCharacter",
         sep_column_position: int=0,
@@ -238,8 +334,8 @@ class Ui:
         include_skills: bool=False,
         include_effects: bool=True
         ):
-        """Displays the statistics of two characters side by side.
-        
+        """Build the side-by-side statistics lines without printing them.
+
         Parameters
         ----------
         character_one : BaseCharacter
@@ -254,11 +350,12 @@ class Ui:
             Whether to include skills. Defaults to False. 
         include_effects : bool
             Whether to include active effects stats. Defaults to True.
-        """
 
-        def add_seperator(string: str):
-            # add the seperator at its start position in a string and return back the string
-            return string[:sep_column_position] + sep + string[len(sep) + sep_column_position - 1:]
+        Returns
+        -------
+        stat_display_lines : list of str
+            The combined stats lines, top to bottom.
+        """
 
         def create_stats_line(character):
             # define the stat title and the display of that stat
@@ -277,84 +374,135 @@ class Ui:
                 "Luck": f"{character.luck} Points"
             }
 
-            # list of stats line
-            stats_line = []
-
-            # iterate through each and every stats
-            for stat_name, stat_display in stats.items():
+            # list of stats line, without column padding; the fused
+            # assembly below places each column directly
+            stats_line = [
+                f"{stat_name}: {stat_display}"
+                for stat_name, stat_display in stats.items()
+            ]
 
-                # place the stat line string at the character's starting position
-                line = Ui.place_string(
-                    f"{stat_name}: {stat_display}",
-                    character.starting_column_position
-                )
-
-                # append the line to stats_line list
-                stats_line.append(line)
-
-            # checks if character have certain attributes
-            attribute_check = all(
-                    [
-                    hasattr(character, "magic_points"),
-                    hasattr(character, "active_effects"),
-                    hasattr(character, "skills")
-                        ]
-                )
-            if attribute_check:
+            # a single class-level flag replaces the old triple hasattr
+            # check that ran for both characters on every frame
+            if character.is_player:
                 # add magic points stats
-                stats_line.append(
-                    Ui.place_string(
-                        f"Magic: {character.magic_points} Points",
-                        character.starting_column_position
-                    )
-                )
+                stats_line.append(f"Magic: {character.magic_points} Points")
 
-                # add active effects if include_effects is True
+                # add active effects if include_effects is True; the
+                # character caches the joined string itself
                 if include_effects:
-                    # seperate active effects with a comma
-                    active_effects = ', '.join(str(effect) for effect in character.active_effects)
-
-                    stats_line.append(
-                    Ui.place_string(
-                        f"Effects: {active_effects}",
-                        character.starting_column_position
-                    )
-                )
+                    stats_line.append(f"Effects: {character.effects_display()}")
 
                 # add skills if include_skills is True
                 if include_skills:
-                    # seperate skills with a comma
-                    skills = ', '.join(str(skill.name) for skill in character.skills)
-
-                    stats_line.append(
-                    Ui.place_string(
-                        f"Skills: {skills}",
-                        character.starting_column_position
-                    )
-                )
+                    stats_line.append(f"Skills: {character.skills_display()}")
 
             return stats_line
 
         # create stats_line for both characters
         stats_lines = [create_stats_line(character_one), create_stats_line(character_two)]
 
-        # get length of longer list
-        max_length = len(max(stats_lines))
+        # the left column runs from character one's starting position up
+        # to the seperator; computed once instead of the old
+        # overwrite-and-reslice per row
+        left_start = character_one.starting_column_position
+        left_width = sep_column_position
+
+        # combine both characters stats into a single line: left column
+        # padded to the seperator, then seperator, then right column;
+        # zip_longest fills the shorter list in place of the old
+        # measure-and-pad pass
+        return [
+            Ui.place_string(line1, left_start).ljust(left_width) + sep + line2
+            for line1, line2 in zip_longest(stats_lines[0], stats_lines[1], fillvalue="")
+        ]
 
-        # match the length of the lists
-        for stats_line in stats_lines:
-            stats_line += [""] * (max_length - len(stats_line))
+    @staticmethod
+    def display_combat_stats(
+        character_one: "BaseCharacter",
+        character_two: "BaseCharacter",
+        sep_column_position: int=0,
+        sep: str="|",
+        include_skills: bool=False,
+        include_effects: bool=True
+        ):
+        """Displays the statistics of two characters side by side.
 
-        stat_display_lines = []
+        Parameters
+        ----------
+        character_one : BaseCharacter
+            The first character object.
+        character_two : BaseCharacter
+            The second character object.
+        sep : str
+            The seperator string between the characters stats. Defaults to "|".
+        seperator_column_position : int
+            The column position of the seperator. Defaults to 1.
+        include_skills : bool
+            Whether to include skills. Defaults to False.
+        include_effects : bool
+            Whether to include active effects stats. Defaults to True.
+        """
 
-        # combine both characters stats into a single line
-        # as well as add the seperator in
-        for line1, line2 in zip(stats_lines[0], stats_lines[1]):
-            stat_display_lines.append(add_seperator(f"{line1}{line2[len(line1):]}"))
+        print("\n".join(Ui._render_combat_stats(
+            character_one,
+            character_two,
+            sep_column_position,
+            sep=sep,
+            include_skills=include_skills,
+            include_effects=include_effects
+            )))
 
-        # print out the stats
-        print("\n".join(stat_display_lines))
+    # the last combat frame drawn, used for differential redraws; any
+    # clear_terminal invalidates it
+    _last_frame: List[str] = None
 
+    # state key of the last combat frame, so frames where nothing
+    # visible changed skip rendering entirely
+    _last_state_key: tuple = None
+
+    @staticmethod
+    def _draw_frame(frame: List[str]):
+        """Draw a frame, rewriting only the lines that changed.
+
+        The first frame (or a frame shorter than the previous one) is a
+        full clear-and-redraw; later frames reposition the cursor with
+        ANSI escapes and rewrite changed or appended lines only, so a
+        small HP change retransmits a couple of lines instead of the
+        whole screen.
+
+        Parameters
+        ----------
+        frame : list of str
+            The lines of the new frame, top to bottom.
+        """
+
+        last_frame = Ui._last_frame
+        out = []
+
+        if last_frame is None or len(frame) < len(last_frame):
+            # full redraw: clear screen, home the cursor, emit everything
+            out.append("\x1b[2J\x1b[H")
+            out.append("\n".join(frame))
+            out.append("\n")
+
+        else:
+            # rewrite only the lines that differ from the last frame
+            for row, (old_line, new_line) in enumerate(zip(last_frame, frame)):
+                if old_line != new_line:
+                    out.append(f"\x1b[{row + 1};1H\x1b[2K{new_line}")
+
+            # emit any lines appended past the old frame's end
+            for row in range(len(last_frame), len(frame)):
+                out.append(f"\x1b[{row + 1};1H\x1b[2K{frame[row]}")
+
+            # park the cursor below the frame and wipe whatever the
+            # previous prompt left there
+            out.append(f"\x1b[{len(frame) + 1};1H\x1b[0J")
+
+        sys.stdout.write("".join(out))
+        sys.stdout.flush()
+
+        Ui._last_frame = frame
 
     @staticmethod
     def display_combat_screen(
@@ -363,7 +511,7 @@ class Ui:
         battle_log: List[str]
         ):
         """Displays the whole combat screen.
-        
+
         player_character : BaseCharacter
             The player character object.
         enemy_character : EnemyCharacter
@@ -371,494 +519,60 @@ class Ui:
         battle_log : list of str
             The battle logs.
         """
+        # everything the frame displays, cheap to compare; if none of it
+        # changed since the last frame, skip rebuilding the frame and
+        # just reposition the cursor below it
+        state_key = (
+            id(player_character),
+            player_character.health_points,
+            player_character.defense_points,
+            player_character.speed_points,
+            player_character.attack_points,
+            player_character.luck,
+            getattr(player_character, "magic_points", 0),
+            tuple(map(str, getattr(player_character, "active_effects", {}).values())),
+            id(enemy_character),
+            enemy_character.health_points,
+            enemy_character.defense_points,
+            enemy_character.speed_points,
+            # the log is a bounded deque, so its length stops changing
+            # once it fills up; compare the contents instead
+            tuple(battle_log),
+        )
+
+        if state_key == Ui._last_state_key and Ui._last_frame is not None:
+            # nothing visible changed: _draw_frame finds zero differing
+            # lines and only parks the cursor below the frame
+            Ui._draw_frame(Ui._last_frame)
+            return
+
         # define the seperator between character and enemy
         seperator = " " * 20
 
-        # print ASCII Art and get the start position of seperator
-        seperator_column_position = Ui.display_ascii_art(
+        # build the ASCII Art lines and get the start position of seperator
+        art_lines, seperator_column_position = Ui._render_ascii_art(
             player_character,
             enemy_character,
             sep=seperator
             )
 
-        # display the stats of the characters
-        Ui.display_combat_stats(
+        # build the stats lines of the characters
+        stats_lines = Ui._render_combat_stats(
             player_character,
             enemy_character,
             seperator_column_position[0],
             sep=seperator
             )
 
-        print()
-
-        # display's battle log
-        print("COMBAT LOG")
-        print("==========")
-        print("\n".join(battle_log))
-        print("==========")
-
-    class Animation:
-        """Container class for animation functions."""
-
-        @staticmethod
-        def print_with_animation(
-            string: AnyStr = None,
-            line_length: int = 80,
-            speed: int = 500
-        ) -> None:
-            """Prints text with typing animation.
-
-            Parameters
-            ----------
-            string : str
-                The string to print. Defaults to None.
-
-            line_length : int
-                Max number of characters per line. Defaults to 80.
-
-            speed : int 
-                The speed of the typing animation (characters per minute).
-                Defaults to 500.
-            """
-            skip = False
-            finished = False
-            string = string.replace("\n", "")
-
-            def listen_for_skip():
-                # listens for skip
-                nonlocal skip
-                # for windows
-                if os.name == "nt":
-                    while not finished:
-                        # listen for spacebar
-                        if msvcrt.kbhit() and ord(msvcrt.getch()) == 32:
-                            skip = True
-                            break
-
-                # for unix based systems
-                else:
-                    while not finished:
-                        # listen for spacebar
-                        if sys.stdin.read(1) == " ":
-                            skip = True
-                            break
-
-            # create and start the skip listening thread
-            space_bar_thread = threading.Thread(target=listen_for_skip)
-            space_bar_thread.start()
-
-            buffer = ""
-
-            print("Press [space bar] to skip...")
-
-            # loops through every character in the string provided and prints
-            # it one by one
-            for char in string:
-
-                # check if skip is activated
-                if skip:
-                    Ui.clear_terminal()
-                    print()
-                    # prints everything with line break
-                    print('\n'.join(textwrap.wrap(string, line_length)))
-                    break
-
-                buffer += char
-                sys.stdout.write(char)
-
-                # checks if line exceeded line_length limit
-                if char == " " and len(buffer) > line_length:
-                    sys.stdout.write("\n")  # insert new line
-                    buffer = ""  # resets buffer
-
-                # sets the speed of typing animation, skips if char is a space
-                if not char.isspace():
-                    time.sleep(speed / (5*3600))
-
-                # pause at a fullstop
-                if char == ".":
-                    time.sleep(0.3)
-
-                sys.stdout.flush()
-
-            finished = True
-
-        @staticmethod
-        def print_line_by_line(string, delay=0.1):
-            """Scrolling up animation for printing text.
-            
-            Parameters
-            ----------
-            string : str
-                The string to print.
-            delay : float
-                The delay in seconds. Defaults to 0.1.
-            """
-
-            lines = string.split("\n")
-
-            for line in lines:
-                print(line)
-                time.sleep(delay)
-
-        @staticmethod
-        def display_welcome_screen():
-            """Prints the welcome screen."""
-
-            # clears terminal screen
-            Ui.clear_terminal()
-
-            Ui.Animation.print_line_by_line(r"""
-CATastrophe Chronicles: The Wildcat Cafe
-──────────┰──────────────────┰──────────
-          ┃                  ┃
-      ╭──━┸━─━─━─━─━─━─━─━─━─┷─━─╮
-      ┃                          ┃
-      │        Welcome To        │
-      │    The Wildcat Cafe!     │
-      ┃                          ┃
-      ╰─━─━─━─━─━─━─━─━─━─━─━─━─━╯
-            """)
-
-            Ui.Animation.print_line_by_line(r"""
-           _   _._
-          |_|-'_~_`-._
-       _.-'-_~_- _-~-_`-._
-   _.-'_~-_~-_-~-_~_~-_~-_`-._
-  ━━┳━━━━━━━━━━━━━━━━━━━━━━━┳━━
-    ┃  ┌─┬─┐    σ    ┌─┬─┐  ┃
-    ┃  ├─┼─┤  ┏━━━┓  ├─┼─┤  ┃   
-  ._┃  └─┴─┘  ┃  .┃  └─┴─┘  ┃_._._._._._._._._._._._._._._._._.  
-  |=┗━━━━━━━━━┻━━━┻━━━━━━━━━┛|=|=|=|=|=|=|=|=|=|=|=|=|=|=|=|=|=| 
-^^^^^^^^^^^^^^ === ^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^  
-    __________    ===             : ¨·.·¨ :
-   <_CatσCafe_>     ===            ` ·. 🦋
-       ^|^            ===                   ╱|、
-        |                ===              (˚ˎ。7               
-                            ===            |、˜〵        
-                            ===            じしˍ,)ノ          
-            """)
-
-        @staticmethod
-        def display_combat_start(
-            player_characters: List["BaseCharacter"],
-            enemy_characters: List["EnemyCharacter"]
-            ):
-            """Displays the animation before the start of combat.
-            
-            Parameters
-            ----------
-            player_characters : List of BaseCharacter
-                The player characters involved in the combat.
-            enemy_characters : List of EnemyCharacter
-                The enemy characters involved in the combat.
-            """
-
-            def display_teams(team: list):
-                # display the whole team and the characters names
-
-                # variable to store each characters name and their starting column position
-                character_names_list = []
-
-                Ui.display_ascii_art(*team, sep="")
-
-                # loop through every character
-                for character in team:
-
-                    # add names below their ascii art respectively
-                    character_names_list.append(
-                        (f"Name: {character.name}", character.starting_column_position)
-                        )
-
-                # align character names to their respective position
-                character_names_line = ''
-                for string, column in character_names_list:
-                    character_names_line += ("\t"+string).expandtabs(column-len(string))
-
-                # print the formatted line
-                print(character_names_line)
-
-            Ui.clear_terminal()
-
-            # display player characters
-            display_teams(player_characters)
-            time.sleep(1)
-            Ui.clear_terminal()
-
-            print("""\n\n\n
- oooooo     oooo  .oooooo..o 
-  `888.     .8'  d8P'    `Y8 
-   `888.   .8'   Y88bo.      
-    `888. .8'     `"Y8888o.  
-     `888.8'          `"Y88b 
-      `888'      oo     .d8P 
-       `8'       8""88888P'  
-            """)
-            time.sleep(1)
-            Ui.clear_terminal()
-
-            # display enemy characters
-            display_teams(enemy_characters)
-            time.sleep(1)
-            Ui.clear_terminal()
-
-            print("""\n\n\n
-________  ______   ______   __    __  ________  __ 
-/        |/      | /      \\ /  |  /  |/         |/ |
-$$$$$$$$/ $$$$$$/ /$$$$$$  |$$ |  $$ |$$$$$$$$/ $$ |
-$$ |__      $$ |  $$ | _$$/ $$ |__$$ |   $$ |   $$ |
-$$    |     $$ |  $$ |/    |$$    $$ |   $$ |   $$ |
-$$$$$/      $$ |  $$ |$$$$ |$$$$$$$$ |   $$ |   $$/ 
-$$ |       _$$ |_ $$ \\__$$ |$$ |  $$ |   $$ |    __ 
-$$ |      / $$   |$$    $$/ $$ |  $$ |   $$ |   /  |
-$$/       $$$$$$/  $$$$$$/  $$/   $$/    $$/    $$/                              
-            """)
-            time.sleep(1)
-
-        @staticmethod
-        def display_game_over():
-            """Displays game over ASCII Art,"""
-
-            Ui.Animation.print_line_by_line(
-                """\n\n\n
-  ______    ______   __       __  ________ 
- /      \\  /      \\ /  \\     /  |/        |
-/$$$$$$  |/$$$$$$  |$$  \\   /$$ |$$$$$$$$/ 
-$$ | _$$/ $$ |__$$ |$$$  \\ /$$$ |$$ |__    
-$$ |/    |$$    $$ |$$$$  /$$$$ |$$    |   
-$$ |$$$$ |$$$$$$$$ |$$ $$ $$/$$ |$$$$$/    
-$$ \\__$$ |$$ |  $$ |$$ |$$$/ $$ |$$ |_____ 
-$$    $$/ $$ |  $$ |$$ | $/  $$ |$$       |
- $$$$$$/  $$/   $$/ $$/      $$/ $$$$$$$$/ 
-            """
-            )
-            Ui.Animation.print_line_by_line("""
-  ______   __     __  ________  _______  
- /      \\ /  |   /  |/        |/       \\ 
-/$$$$$$  |$$ |   $$ |$$$$$$$$/ $$$$$$$  |
-$$ |  $$ |$$ |   $$ |$$ |__    $$ |__$$ |
-$$ |  $$ |$$  \\ /$$/ $$    |   $$    $$< 
-$$ |  $$ | $$  /$$/  $$$$$/    $$$$$$$  |
-$$ \\__$$ |  $$ $$/   $$ |_____ $$ |  $$ |
-$$    $$/    $$$/    $$       |$$ |  $$ |
- $$$$$$/      $/     $$$$$$$$/ $$/   $$/                                                                                       
-            """)
-
-        @staticmethod
-        def display_thunderstorm(frames: int=20, flash: bool=True):
-            """Animate a thunderstorm in console.
-            
-            Parameters
-            ----------
-            frames : int
-                The amount of frames to animate. Defaults to 20.
-            flash : bool
-                Whether to display lightning flashes. Defaults to True.
-            """
-
-            width, height = os.get_terminal_size()
-
-            running_animation = True
-
-            def lightning_animation():
-                # for windows
-                if os.name == "nt":
-                    while running_animation:
-                        for _ in range(2):
-                            # flash twice
-                            os.system("color 70")
-                            time.sleep(0.2)
-                            os.system("color 07")
-                            time.sleep(0.2)
-
-                        time.sleep(3)
-
-            if flash:
-                # run the lightning animation in the background
-                lightning_animation = threading.Thread(target=lightning_animation)
-                lightning_animation.start()
-
-            raindrops = ""
-            rain_animation = []
-
-            # create raining animation
-            for _ in range(frames):
-                for _ in range(height-1):
-                    for _ in range(width//3):
-                        raindrops += " / " * random.randint(0, 1) + "   " * random.randint(1, 5)
-                    rain_animation.append(raindrops[:width])
-                    raindrops = ""
-
-                print("\n".join(rain_animation))
-                rain_animation = []
-                time.sleep(0.5)
-                Ui.clear_terminal()
-
-            running_animation = False
-
-
-    class Menu:
-        """Represents a UI Menu.
-
-        Attributes
-        ----------
-        title : str
-            The title of the menu.
-        options : Dict
-            The available options in the menu.
-        """
-
-        def __init__(self, title: str, options_dict: Dict):
-            """Initialize a UI Menu instance.
-
-            Parameters
-            ----------
-            title : str
-                The title of the menu.
-            options_dict : Dict
-                A dictionary where the key represents the display text of each option, and the
-                values represent the corresponding return values.
-            """
-            self.title = title
-            self.options = {}
-
-            # set the last menu option to be quit
-            options_dict["Quit"] = "Quit"
-
-            # assign values to self.options
-            for index, items in enumerate(options_dict.items(), start=1):
-                # structure of self.options:
-                # self.options = {
-                #     index: {
-                #         "display": items[0],
-                #         "return": items[1]
-                #         }
-                # }
-
-                # set key as index and value as empty dict
-                options_index = self.options[index] = {}
-
-                # set display and return values
-                options_index["display"] = items[0]
-                options_index["return"] = items[1]
-
-        def display(self, padding: int = 5, print_line_by_line: bool=False):
-            """Display the UI Menu.
-
-            Parameters
-            ----------
-            padding : int, optional
-                The number of spaces for padding around the menu content (default is 5).
-            print_line_by_line : bool
-                Whether to print the menu line by line. Default to False.
-            """
-
-            def wrap_string(string: str, wrapper: str):
-                # wrap a string with a given wrapper string.
-                return wrapper + string + wrapper
-
-            title_length = len(self.title)
-
-            # the length of the longest display string
-            max_display_length = max(len(str(item['display'])) for item in self.options.values())
-
-            # account for the numbering at the start of every option
-            max_display_length += 2
-
-            # if title_length more than or equals to max_display_length, box length will
-            # correspond to the title_length
-            if title_length >= max_display_length:
-                box_length = title_length + (padding * 2) + 2
-
-            # else, box length will correspond to the max_display_length
-            else:
-                box_length = max_display_length + (padding * 2) + 2
-
-            # the lines in the menu display
-            menu_lines = []
-
-            # add the top border of the menu box
-            menu_lines.append("╔" + "═" * (box_length - 2) + "╗")
-
-            # add the menu title with padding and wrap it with border
-            menu_lines.append(wrap_string(self.title.center(box_length - 2), "║"))
-
-            # add the middle border of the menu box
-            menu_lines.append("╠" + "═" * (box_length - 2) + "╣")
-
-            # add each option with leading index and trailing whitespace for alignment
-            for index, items in self.options.items():
-                # get the display text from the nested dict
-                display_text = items["display"]
-
-                # format index and option
-                option_str =f"{index}. {display_text}"
-
-                # add trailling whitespace for alignment
-                formatted_option_str = f"{option_str:<{box_length-2}}"
-
-                # add formatted_option_str and wraps it with the box border
-                menu_lines.append(wrap_string(formatted_option_str, "║"))
-
-            # add the bottom border of the menu box
-            menu_lines.append("╚" + "═" * (box_length - 2) + "╝")
-
-            # string combined with newline
-            menu_string = "\n".join(menu_lines)
-
-            if print_line_by_line:
-                Ui.Animation.print_line_by_line(menu_string)
-
-            else:
-                print(menu_string)
-
-
-        def select_option(self, print_line_by_line: bool=False, invalid_handler: Callable=None):
-            """Select an option from the menu and return the chosen option.
-
-            Parameters
-            ----------
-            print_line_by_line : bool
-                Whether to print the menu line by line. Default to False.
-            invalid_handler : Callable
-                The function to run when an invalid option is given.
-
-            Returns
-            -------
-            Any : 
-                The value associated with the selected option.
-
-            """
-
-            # runs forever until a valid input is given
-            while True:
-                # display the menu
-                self.display(print_line_by_line=print_line_by_line)
-
-                # gets user input
-                choice = input("> ")
-
-                # checks if user input is valid
-                if choice.isdigit() and int(choice) in self.options:
-                    # checks if Quit option is selected
-                    if str(self.options[int(choice)]["return"]).lower() == "quit":
-                        print("Quitting game...")
-
-                        # wait 1 second before exiting script
-                        time.sleep(1)
-                        sys.exit()
-
-                    # return chosen option corresponding return value
-                    return self.options[int(choice)]["return"]
-
-                # check if invalid_handler is given
-                if invalid_handler:
-                    invalid_handler()
-
-                else:
-                    # auto handles invalid input by running itself again
-                    print("Invalid choice. Please enter again.")
-
-                    # clears terminal after 1 second
-                    time.sleep(1)
-                    Ui.clear_terminal()
+        # assemble the whole frame in memory, battle log included; log
+        # entries can embed newlines (skill messages do), so split them
+        # to keep one frame entry per physical terminal row, which the
+        # row-addressed writes in _draw_frame rely on
+        frame = art_lines + stats_lines + ["", "COMBAT LOG", "=========="]
+        for entry in battle_log:
+            frame.extend(entry.split("\n"))
+        frame.append("==========")
+
+        # draw only what changed since the last frame
+        Ui._draw_frame(frame)
+        Ui._last_state_key = state_key
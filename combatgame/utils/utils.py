@@ -1,6 +1,55 @@
 """Utility functions for project."""
 import csv
+from functools import lru_cache
+from types import MappingProxyType
 
+# optional fast path: pyarrow parses CSV in native code, well ahead of
+# any pure-Python reader on larger config files; the stdlib reader
+# below stays as the fallback when it isn't installed
+try:
+    import pyarrow as _pa
+    import pyarrow.csv as _pa_csv
+except ImportError:
+    _pa = None
+
+
+def _csv_to_dict_arrow(file_path: str, key_column: str) -> dict:
+    """csv_to_dict body on top of pyarrow's native CSV parser.
+
+    Parameters
+    ----------
+    file_path : str
+        The file path of the csv file.
+    key_column : str
+        The column for keys.
+    """
+
+    # read the header first so every column can be pinned to string,
+    # matching what the stdlib reader returns
+    with open(file_path, "r", encoding="utf-8", newline="") as file:
+        header = next(csv.reader(file))
+
+    table = _pa_csv.read_csv(
+        file_path,
+        convert_options=_pa_csv.ConvertOptions(
+            column_types={column: _pa.string() for column in header}
+        ),
+    )
+
+    # pull each column out once
+    columns = {
+        column: table.column(column).to_pylist() for column in table.column_names
+    }
+
+    keys = columns.pop(key_column)
+
+    return MappingProxyType({
+        key: {column: values[index] for column, values in columns.items()}
+        for index, key in enumerate(keys)
+    })
+
+
+@lru_cache(maxsize=None)
 def csv_to_dict(file_path: str, key_column: str) -> dict:
     """Reads csv config file and store it in a dictionary.
     
@@ -11,18 +60,109 @@ def csv_to_dict(file_path: str, key_column: str) -> dict:
     key : str
         The column for keys.
     """
+    # take the native parser when it's available
+    if _pa is not None:
+        return _csv_to_dict_arrow(file_path, key_column)
+
     result_dict = {}
 
-    # open the CSV file
-    with open(file_path, "r", encoding="utf-8") as file:
-        # converts csv file to python dictionary
-        csv_to_dict_reader = csv.DictReader(file)
+    # open the CSV file; newline="" is the csv-module recommended
+    # setting (no double newline translation), and the large buffer
+    # pulls a whole config file in with one read syscall
+    with open(
+        file_path, "r", encoding="utf-8", newline="", buffering=1 << 20
+    ) as file:
+        # plain reader instead of DictReader: no per-row dict build
+        # followed by a pop scan for the key column
+        reader = csv.reader(file)
+
+        # read the header once and resolve the key column index
+        header = next(reader)
+        key_index = header.index(key_column)
+
+        # (index, column name) pairs for every non-key column
+        other_columns = [
+            (index, column) for index, column in enumerate(header)
+            if index != key_index
+        ]
 
         # iterate over each row and convert it to a dictionary
-        for row in csv_to_dict_reader:
+        for row in reader:
 
             # assign the key name to its dict of attributes
-            key = str(row.pop(key_column))
-            result_dict[key] = row
+            result_dict[row[key_index]] = {
+                column: row[index] for index, column in other_columns
+            }
+
+    # the parse is cached, so hand every caller the same read-only view
+    # rather than a dict one of them could mutate for the rest
+    return MappingProxyType(result_dict)
+
+
+def iter_csv_rows(file_path: str, key_column: str):
+    """Yield (key, row dict) pairs from a csv config file on demand.
+
+    Unlike csv_to_dict this never materializes the whole table, so a
+    caller that only needs one row can break out early with constant
+    memory.
+
+    Parameters
+    ----------
+    file_path : str
+        The file path of the csv file.
+    key_column : str
+        The column for keys.
+
+    Yields
+    ------
+    tuple : (key, dict of the other columns) per row.
+    """
+
+    with open(
+        file_path, "r", encoding="utf-8", newline="", buffering=1 << 20
+    ) as file:
+        reader = csv.reader(file)
+
+        # read the header once and resolve the key column index; the
+        # None default keeps an empty file from raising StopIteration
+        # inside the generator (PEP 479 turns that into RuntimeError)
+        header = next(reader, None)
+        if header is None:
+            return
+
+        key_index = header.index(key_column)
+
+        # (index, column name) pairs for every non-key column
+        other_columns = [
+            (index, column) for index, column in enumerate(header)
+            if index != key_index
+        ]
+
+        for row in reader:
+            yield row[key_index], {
+                column: row[index] for index, column in other_columns
+            }
+
+
+def lookup_csv(file_path: str, key_column: str, key: str) -> dict:
+    """Return the row for one key, stopping at the first match.
+
+    Parameters
+    ----------
+    file_path : str
+        The file path of the csv file.
+    key_column : str
+        The column for keys.
+    key : str
+        The key of the wanted row.
+
+    Returns
+    -------
+    dict : The row's other columns, or None if the key is absent.
+    """
+
+    for row_key, row in iter_csv_rows(file_path, key_column):
+        if row_key == key:
+            return row
 
-    return result_dict
+    return None
@@ -9,117 +9,122 @@ Date:
 Usage:
     python main.py
 """
+import contextlib
+import io
+import sys
 from functools import partial
 
 from combatgame.ui import Ui
+from combatgame.animations import Animation
+from combatgame.menus import Menu
 from combatgame.scenes import Scenes
 from combatgame.characters import Tank, MirrorMage, Healer, Assassin
-from combatgame.skills import Skills, BaseSkill
+from combatgame.skills import (
+    BaseSkill,
+    WhiskerGuard, ClawSwipe, IllusionaryAura, ReflectiveShield,
+    HealingPurr, LuckyCharm, PurrfectStrike, CripplingStrike,
+)
+
+# screen sentinels: menu Back entries return one of these instead of
+# calling the previous screen's function, and the driver loop in main()
+# dispatches on them -- this replaces the old mutual recursion between
+# main() and HelpMenu.main(), which grew the call stack on every trip
+# through the menus
+SCREEN_MAIN = "main menu"
+SCREEN_HELP = "help menu"
+
 
 def main():
-    """Main game flow."""
+    """Main game flow: drives the screen state machine."""
 
     scenes = Scenes()
     settings = SettingsMenu()
 
-    while True:
-        start_menu_dict = {
-            "Start": partial(scenes.run_scenes, settings.flash),
-            "Help": HelpMenu.main,
-            "Settings": settings.display_settings
-        }
+    # built once; the Start entry reads settings.flash at call time so
+    # toggling it in the settings menu takes effect without a rebuild
+    start_menu_dict = {
+        "Start": lambda: scenes.run_scenes(settings.flash),
+        "Help": SCREEN_HELP,
+        "Settings": settings.display_settings
+    }
+    start_menu = Menu("CATastrophe Chronicles", start_menu_dict)
 
-        Ui.Animation.display_welcome_screen()
+    def main_screen():
+        # run one start menu selection and return the next screen
+        Animation.display_welcome_screen()
 
-        start_menu = Ui.Menu("CATastrophe Chronicles", start_menu_dict)
         selected = start_menu.select_option(print_line_by_line=True)
 
+        if selected is SCREEN_HELP:
+            return SCREEN_HELP
+
         if callable(selected):
             selected()
         else:
             print("Not callable")
 
-class HelpMenu:
-    """Container class for help menu."""
-
-    @staticmethod
-    def main():
-        """Main HelpMenu function for displaying main help menu."""
-
-        # create dictionary for main help menu
-        help_menu_dict = {
-            "Job Classes": HelpMenu.job_classes,
-            "Skills": HelpMenu.skills,
-            "Back": main
-        }
+        return SCREEN_MAIN
 
-        Ui.clear_terminal()
-
-        # display main help menu
-        menu = Ui.Menu("Help Menu", help_menu_dict)
-        selected_option = menu.select_option()
-        selected_option()
+    screens = {
+        SCREEN_MAIN: main_screen,
+        SCREEN_HELP: HelpMenu.main,
+    }
 
-    @staticmethod
-    def job_classes():
-        """Function for displaying job classes help."""
-
-        Ui.clear_terminal()
-
-        tank = Tank("Tank")
-        mirrormage = MirrorMage("MirrorMage")
-        healer = Healer("Healer")
-        assassin = Assassin("Assassin")
+    # the driver loop: each screen function runs one interaction and
+    # returns the sentinel of the screen to show next
+    screen = SCREEN_MAIN
+    while True:
+        screen = screens[screen]()
 
-        seperator = " " * 10
+class HelpMenu:
+    """Container class for help menu."""
 
-        def page_one():
-            # display page one
+    # help screen fixtures, built lazily on the first visit (see
+    # _build_fixtures) so starting the game does not pay for pages
+    # nobody opens
+    _help_menu = None
+    _job_classes_menu = None
+    _skills_menu = None
 
-            Ui.clear_terminal()
-            Ui.print_box("Page 1 - Tank and MirrorMage")
+    @classmethod
+    def main(cls):
+        """Main HelpMenu function for displaying main help menu.
 
-            # print ascii art and combat stats
-            seperator_column_position = Ui.display_ascii_art(tank, mirrormage, sep=seperator)
-            Ui.display_combat_stats(
-                tank, mirrormage, seperator_column_position[0],
-                sep=seperator, include_effects=False, include_skills=True
-                )
+        Returns
+        -------
+        str : The next screen sentinel for the driver loop in main().
+        """
 
-            print()
-            Ui.print_box("Page 1 - Tank and MirrorMage")
+        cls._build_fixtures()
 
-            input("\nPress enter to go back...")
+        Ui.clear_terminal()
 
-        def page_two():
-            # display page two
+        # display main help menu (built once on first visit)
+        selected_option = cls._help_menu.select_option()
 
-            Ui.clear_terminal()
-            Ui.print_box("Page 2 - Healer and Assassin")
+        # the Back entry: hand control back to the main screen
+        if selected_option is SCREEN_MAIN:
+            return SCREEN_MAIN
 
-            # print ascii art and combat stats
-            seperator_column_position = Ui.display_ascii_art(healer, assassin, sep=seperator)
-            Ui.display_combat_stats(
-                healer, assassin, seperator_column_position[0],
-                sep=seperator, include_effects=False, include_skills=True
-                )
+        # job_classes/skills run until their own Back entry is chosen
+        selected_option()
+        return SCREEN_HELP
 
-            print()
-            Ui.print_box("Page 2 - Healer and Assassin")
+    @classmethod
+    def job_classes(cls):
+        """Function for displaying job classes help."""
 
-            input("\nPress enter to go back...")
+        cls._build_fixtures()
 
-        # craete dictionary for menu
-        job_classes_dict = {
-            "Page 1": page_one,
-            "Page 2": page_two,
-            "Back": HelpMenu.main
-        }
+        Ui.clear_terminal()
 
         while True:
             # display the menu
-            job_classes_menu = Ui.Menu("Job Class Help", job_classes_dict)
-            selected_option = job_classes_menu.select_option()
+            selected_option = cls._job_classes_menu.select_option()
+
+            # the Back entry: return to the help menu screen
+            if selected_option is SCREEN_HELP:
+                return
 
             # run the selected option
             selected_option()
@@ -127,65 +132,173 @@ class HelpMenu:
             Ui.clear_terminal()
 
     @staticmethod
-    def skills():
-        """Function for displaying skills info."""
+    def display_job_page(page_text: str):
+        """Displays one pre-rendered job classes help page.
+
+        Parameters
+        ----------
+        page_text : str
+            The full page text, captured once at import.
+        """
 
-        # store all skills in a list
-        skills = [
-            Skills.WhiskerGuard(), Skills.ClawSwipe(),
-            Skills.IllusionaryAura(), Skills.ReflectiveShield(),
-            Skills.HealingPurr(), Skills.LuckyCharm(),
-            Skills.PurrfectStrike(), Skills.CripplingStrike()
-            ]
-
-        def display_skill_info(skill: BaseSkill):
-            # function to display skill info
-            print(f"Name: {skill.name}")
-            print(f"Belongs to: {skill.belongs_to}")
-            print(f"Description: {skill.description}")
-            print("Cost:")
-            print(f"{skill.speed_points_cost} Speed Points")
-            print(f"{skill.magic_points_cost} Magic Points")
-            input("\nPress enter to go back...")
-
-        # create dictionary for menu with every skill in skills
-        skills_menu_dict = {
-            skill.name: partial(display_skill_info, skill) for skill in skills
-        }
-        # include the back option
-        skills_menu_dict["Back"] = HelpMenu.main
+        Ui.clear_terminal()
+        sys.stdout.write(page_text)
+
+        input("\nPress enter to go back...")
+
+    @staticmethod
+    def display_skill_info(skill: BaseSkill):
+        """Displays one skill's info.
+
+        Parameters
+        ----------
+        skill : BaseSkill
+            The skill to display.
+        """
+
+        print(f"Name: {skill.name}")
+        print(f"Belongs to: {skill.belongs_to}")
+        print(f"Description: {skill.description}")
+        print("Cost:")
+        print(f"{skill.speed_points_cost} Speed Points")
+        print(f"{skill.magic_points_cost} Magic Points")
+        input("\nPress enter to go back...")
+
+    @classmethod
+    def skills(cls):
+        """Function for displaying skills info."""
 
+        cls._build_fixtures()
 
         while True:
-            # display the menu
-            skills_menu = Ui.Menu("Skill Help", skills_menu_dict)
-            selected_option = skills_menu.select_option()
+            # display the menu; skill entries return the skill itself,
+            # so there is no per-skill partial to allocate or call
+            selected = cls._skills_menu.select_option()
 
-            # run the selected option
-            selected_option()
+            # the Back entry: return to the help menu screen
+            if selected is SCREEN_HELP:
+                return
+
+            cls.display_skill_info(selected)
             Ui.clear_terminal()
 
+    @classmethod
+    def _build_fixtures(cls):
+        """Builds the help demo characters, skills and menus on first use.
+
+        The character and skill modules themselves are already loaded
+        through Scenes, so only the fixture construction is deferred.
+        """
+
+        # already built on an earlier visit
+        if cls._help_menu is not None:
+            return
+
+        skills = (
+            WhiskerGuard(), ClawSwipe(),
+            IllusionaryAura(), ReflectiveShield(),
+            HealingPurr(), LuckyCharm(),
+            PurrfectStrike(), CripplingStrike(),
+        )
+
+        cls._help_menu = Menu("Help Menu", {
+            "Job Classes": cls.job_classes,
+            "Skills": cls.skills,
+            "Back": SCREEN_MAIN,
+        })
+
+        cls._job_classes_menu = Menu("Job Class Help", {
+            "Page 1": partial(
+                cls.display_job_page,
+                _render_job_page(
+                    "Page 1 - Tank and MirrorMage",
+                    Tank("Tank"), MirrorMage("MirrorMage"),
+                    ),
+                ),
+            "Page 2": partial(
+                cls.display_job_page,
+                _render_job_page(
+                    "Page 2 - Healer and Assassin",
+                    Healer("Healer"), Assassin("Assassin"),
+                    ),
+                ),
+            "Back": SCREEN_HELP,
+        })
+
+        cls._skills_menu = Menu("Skill Help", {
+            **{skill.name: skill for skill in skills},
+            "Back": SCREEN_HELP,
+        })
+
+
+def _render_job_page(title: str, left: Tank, right: Tank) -> str:
+    """Capture one job classes help page as a single string.
+
+    The page content never changes, so it is rendered once at import
+    and replayed with one write on every visit instead of re-running
+    the ascii art and stats layout.
+
+    Parameters
+    ----------
+    title : str
+        The page title printed above and below the stats.
+    left, right : BaseCharacter
+        The two demo characters shown on the page.
+
+    Returns
+    -------
+    str : The full page text.
+    """
+
+    seperator = " " * 10
+    buffer = io.StringIO()
+
+    with contextlib.redirect_stdout(buffer):
+        Ui.print_box(title)
+
+        # print ascii art and combat stats
+        seperator_column_position = Ui.display_ascii_art(left, right, sep=seperator)
+        Ui.display_combat_stats(
+            left, right, seperator_column_position[0],
+            sep=seperator, include_effects=False, include_skills=True
+            )
+
+        print()
+        Ui.print_box(title)
+
+    return buffer.getvalue()
+
+
 class SettingsMenu:
     """Class implementation for settings menu."""
 
     def __init__(self):
         self.flash = True
 
+        # built once; toggling flashes relabels the option in place
+        self._menu = Menu("Settings", {
+            self._flash_label(): self._toggle_flash,
+            "Back": SCREEN_MAIN
+        })
+
+    def _flash_label(self):
+        # the display text of the flashes toggle
+        return f"Flashes ({'On' if self.flash else 'Off'})"
+
+    def _toggle_flash(self):
+        self.flash = not self.flash
+        self._menu.update_label(0, self._flash_label())
+
     def display_settings(self):
         """Displays the settings menu."""
 
-        def toggle_flash():
-            self.flash = not self.flash
-
         while True:
-            settings_menu_dict = {
-                f"Flashes ({'On' if self.flash else 'Off'})": toggle_flash,
-                "Back": main
-            }
-
             # display settings menu
-            settings_menu = Ui.Menu("Settings", settings_menu_dict)
-            selected_option = settings_menu.select_option()
+            selected_option = self._menu.select_option()
+
+            # the Back entry: return to the main screen
+            if selected_option is SCREEN_MAIN:
+                return
 
             selected_option()
             Ui.clear_terminal()
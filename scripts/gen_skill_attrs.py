@@ -0,0 +1,54 @@
+"""Generate combatgame/_skill_attrs_gen.py from skill_attributes.csv.
+
+Run this after editing the CSV so the game loads an already-typed
+Python literal instead of parsing CSV at startup:
+
+    python scripts/gen_skill_attrs.py
+"""
+
+import csv
+import os
+import pprint
+
+# repository root (this file lives in scripts/)
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CSV_PATH = os.path.join(ROOT, "combatgame", "data", "skill_attributes.csv")
+OUT_PATH = os.path.join(ROOT, "combatgame", "_skill_attrs_gen.py")
+
+HEADER = '''"""Typed skill attributes generated from data/skill_attributes.csv.
+
+Generated by scripts/gen_skill_attrs.py -- do not edit by hand; edit
+the CSV and re-run the script instead.
+"""
+
+SKILL_ATTRS = '''
+
+
+def main():
+    """Read the CSV and write the literal module."""
+
+    with open(CSV_PATH, encoding="utf-8", newline="") as file:
+        rows = list(csv.DictReader(file))
+
+    skill_attrs = {
+        row["skill"]: {
+            "name": row["name"],
+            "mp_cost": int(row["mp_cost"]),
+            "sp_cost": int(row["sp_cost"]),
+            "require_target": row["require_target"].lower() == "yes",
+            "belongs_to": row["belongs_to"],
+        }
+        for row in rows
+    }
+
+    with open(OUT_PATH, "w", encoding="utf-8") as file:
+        file.write(HEADER)
+        file.write(pprint.pformat(skill_attrs, sort_dicts=False))
+        file.write("\n")
+
+    print(f"wrote {len(skill_attrs)} skills to {OUT_PATH}")
+
+
+if __name__ == "__main__":
+    main()
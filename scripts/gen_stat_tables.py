@@ -0,0 +1,66 @@
+"""Generate combatgame/_stat_tables_gen.py from the stat CSVs.
+
+Run this after editing job_class_attributes.csv or enemy_attributes.csv
+so the game loads already-typed Python literals instead of parsing CSV
+at startup:
+
+    python scripts/gen_stat_tables.py
+"""
+
+import csv
+import os
+import pprint
+
+# repository root (this file lives in scripts/)
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+JOB_CSV_PATH = os.path.join(ROOT, "combatgame", "data", "job_class_attributes.csv")
+ENEMY_CSV_PATH = os.path.join(ROOT, "combatgame", "data", "enemy_attributes.csv")
+OUT_PATH = os.path.join(ROOT, "combatgame", "_stat_tables_gen.py")
+
+HEADER = '''"""Typed stat tables generated from the data/ CSVs.
+
+Generated by scripts/gen_stat_tables.py -- do not edit by hand; edit
+the CSVs and re-run the script instead.
+"""
+
+'''
+
+
+def read_stats(csv_path: str, key_column: str) -> dict:
+    """Read one CSV into a {key: {stat: int}} dict."""
+
+    with open(csv_path, encoding="utf-8", newline="") as file:
+        rows = list(csv.DictReader(file))
+
+    return {
+        row[key_column]: {
+            stat: int(value)
+            for stat, value in row.items() if stat != key_column
+        }
+        for row in rows
+    }
+
+
+def main():
+    """Read the CSVs and write the literal module."""
+
+    job_stats = read_stats(JOB_CSV_PATH, "job")
+    enemy_stats = read_stats(ENEMY_CSV_PATH, "name")
+
+    with open(OUT_PATH, "w", encoding="utf-8") as file:
+        file.write(HEADER)
+        file.write("JOB_STATS = ")
+        file.write(pprint.pformat(job_stats, sort_dicts=False))
+        file.write("\n\nENEMY_STATS = ")
+        file.write(pprint.pformat(enemy_stats, sort_dicts=False))
+        file.write("\n")
+
+    print(
+        f"wrote {len(job_stats)} jobs and {len(enemy_stats)} enemies "
+        f"to {OUT_PATH}"
+    )
+
+
+if __name__ == "__main__":
+    main()